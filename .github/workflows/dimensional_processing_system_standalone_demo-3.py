@@ -16,21 +16,26 @@ It implements:
 5.  **"Conscious" Hand-off:** The GovernanceEngine hands off
     governance to QUASI crystals, which "govern themselves" using
     their internal 8 Law facets.
+
+Requires Python 3.10+ (``@dataclass(slots=True)``).
 """
 
 import time
 import uuid
 import math
 import random
-from typing import Dict, List, Optional, Any, Tuple, Set, ForwardRef
+import logging
+from array import array
+from typing import Deque, Dict, List, Optional, Any, Tuple, Set, ForwardRef
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor  # ADD THIS LINE
-from collections import defaultdict
 # --- PERFECTION: Added ForwardRef for 'Crystal' type hint ---
 CrystalRef = ForwardRef('Crystal')
 
+# Per-interaction chatter goes through a level-gated logger, not print()
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # 1. CORE DATA STRUCTURES (From memory_domain.py)
 # ============================================================================
@@ -49,91 +54,273 @@ class FacetState(Enum):
     DECAYING = "DECAYING"
     RELIC = "RELIC"
 
-@dataclass
+# --- PERFECTION: Your "8 points per facet", in column order ---
+FACET_POINTS = (
+    "resonance", "sensitivity", "abstractness", "potential",
+    "stability", "coherence", "complexity", "frequency",
+)
+
+# Points are stored quantized as 0..POINT_SCALE bytes (value = byte / POINT_SCALE);
+# they only ever move in 0.02-0.05 steps, so 1/255 resolution is plenty.
+POINT_SCALE = 255
+
+
+def quantize_point(value: float) -> int:
+    """Clamp a [0, 1] point to its stored byte"""
+    q = round(value * POINT_SCALE)
+    return 0 if q < 0 else POINT_SCALE if q > POINT_SCALE else q
+
+
+# Feedback thresholds and steps in quantized units
+_Q_LOW = 0.3 * POINT_SCALE
+_Q_HIGH = 0.7 * POINT_SCALE
+_Q_VERY_HIGH = 0.8 * POINT_SCALE
+_Q_STEP_BOOST = quantize_point(0.05)
+_Q_STEP_DAMP = quantize_point(0.03)
+_Q_STEP_FADE = quantize_point(0.02)
+_Q_FLICKER = 0.1 * POINT_SCALE   # flicker spans +/-0.05
+
+
+def _decay_kernel(confidence, last_accessed, state, rows, now: float, rate: float) -> Tuple[List[int], int]:
+    """
+    Fused decay loop over the confidence/last_accessed/state columns.
+
+    For each non-relic row: confidence -= rate * minutes since last access
+    (floored at 0), then the non-destructive state change. Returns the rows
+    it touched (for the physics feedback) and how many became relics.
+    """
+    relic = FacetState.RELIC
+    decaying = FacetState.DECAYING
+    per_second = rate / 60.0
+    decayed = []
+    new_relics = 0
+    for row in rows:
+        if state[row] is relic:
+            continue # Already a relic
+
+        c = confidence[row] - per_second * (now - last_accessed[row])
+        if c < 0.0:
+            c = 0.0
+        confidence[row] = c
+        decayed.append(row)
+
+        # --- PERFECTION: Non-destructive state change ---
+        # The 'role' is preserved forever
+        if c < 0.1:
+            state[row] = relic
+            new_relics += 1
+        elif c < 0.3:
+            state[row] = decaying
+    return decayed, new_relics
+
+
+class FacetTable:
+    """
+    Column store (SoA) for facets.
+
+    A CrystalMemorySystem keeps one table for all of its crystals (rows are
+    tagged with ``parent_crystal_id``); a Crystal built on its own gets a
+    private table. Each numeric field is one contiguous ``array`` column:
+    the 8 points as quantized bytes, confidence and last_accessed as
+    doubles (decay moves confidence by far less than 1/255 per pass),
+    access_count as ints. Ids, roles, content and state are plain lists.
+    A facet is a row index; ``CrystalFacet`` is a view onto one row. Rows
+    are never removed (relics keep their row).
+    Random draws (initial points, flicker) come from ``rng``.
+    ``relic_version`` changes whenever a row enters or leaves RELIC.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random.Random()
+        self.relic_version = 0
+        self.facet_id: List[str] = []
+        self.parent_crystal_id: List[str] = []
+        self.role: List[str] = []
+        self.content: List[Any] = []
+        self.state: List[FacetState] = []
+        self.confidence = array('d')
+        self.access_count = array('l')
+        self.last_accessed = array('d')
+        self.resonance = array('B')
+        self.sensitivity = array('B')
+        self.abstractness = array('B')
+        self.potential = array('B')
+        self.stability = array('B')
+        self.coherence = array('B')
+        self.complexity = array('B')
+        self.frequency = array('B')
+
+    def __len__(self) -> int:
+        return len(self.facet_id)
+
+    def append(self, facet_id: str, parent_crystal_id: str, role: str,
+               content: Any, confidence: float = 0.5) -> int:
+        """Add a row with fresh random points; returns its index"""
+        row = len(self.facet_id)
+        self.facet_id.append(facet_id)
+        self.parent_crystal_id.append(parent_crystal_id)
+        self.role.append(role)
+        self.content.append(content)
+        self.state.append(FacetState.ACTIVE)
+        self.confidence.append(confidence)
+        self.access_count.append(0)
+        self.last_accessed.append(time.time())
+        draw = self.rng.random
+        for name in FACET_POINTS:
+            getattr(self, name).append(round(draw() * POINT_SCALE))
+        return row
+
+    def strengthen(self, rows, amount: float = 0.1, now: Optional[float] = None):
+        """Strengthen ``rows`` through use with interdependent physics updates"""
+        confidence = self.confidence
+        access_count = self.access_count
+        last_accessed = self.last_accessed
+        state = self.state
+        active = FacetState.ACTIVE
+        relic = FacetState.RELIC
+        if now is None:
+            now = time.time()
+        for row in rows:
+            confidence[row] = min(1.0, confidence[row] + amount)
+            access_count[row] += 1
+            last_accessed[row] = now
+            if state[row] is relic:
+                self.relic_version += 1
+            state[row] = active # Use brings it back from decay
+
+        # Apply facet interdependence: strengthening affects physics points
+        self.apply_boost(rows)
+
+    def decay(self, rows, rate: float = 0.01, now: Optional[float] = None):
+        """Natural decay over time (Ghost Relic system), one pass over ``rows``"""
+        if now is None:
+            now = time.time()
+        decayed, new_relics = _decay_kernel(
+            self.confidence, self.last_accessed, self.state, rows, now, rate
+        )
+        if new_relics:
+            self.relic_version += 1
+
+        # Apply interdependent physics decay
+        self.apply_decay(decayed)
+
+    # Facet physics points influence each other:
+    # - High coherence boosts stability
+    # - High complexity reduces abstractness temporarily
+    # - High potential increases resonance
+
+    def apply_boost(self, rows):
+        """Strengthening creates positive feedback loops across ``rows``"""
+        coherence, stability = self.coherence, self.stability
+        potential, resonance = self.potential, self.resonance
+        complexity, abstractness = self.complexity, self.abstractness
+        top = POINT_SCALE
+        for row in rows:
+            if coherence[row] > _Q_HIGH:
+                stability[row] = min(top, stability[row] + _Q_STEP_BOOST)
+            if potential[row] > _Q_HIGH:
+                resonance[row] = min(top, resonance[row] + _Q_STEP_BOOST)
+            if complexity[row] > _Q_VERY_HIGH:
+                abstractness[row] = max(0, abstractness[row] - _Q_STEP_DAMP)
+
+    def apply_decay(self, rows):
+        """Decay creates negative feedback across ``rows``"""
+        stability, coherence = self.stability, self.coherence
+        complexity, frequency = self.complexity, self.frequency
+        for row in rows:
+            if stability[row] < _Q_LOW:
+                coherence[row] = max(0, coherence[row] - _Q_STEP_DAMP)
+            if complexity[row] > _Q_HIGH:
+                frequency[row] = max(0, frequency[row] - _Q_STEP_FADE)
+
+    def set_state(self, row: int, state: FacetState):
+        """Set one row's state, keeping relic_version in step"""
+        if (self.state[row] is FacetState.RELIC) != (state is FacetState.RELIC):
+            self.relic_version += 1
+        self.state[row] = state
+
+    def get_points(self, row: int) -> Dict[str, float]:
+        """All 8 points of one row, as floats in [0, 1]"""
+        return {name: getattr(self, name)[row] / POINT_SCALE for name in FACET_POINTS}
+
+
+def _facet_column(name: str) -> property:
+    """Property that reads/writes one FacetTable column at the view's row"""
+    def fget(self):
+        return getattr(self.table, name)[self.idx]
+
+    def fset(self, value):
+        getattr(self.table, name)[self.idx] = value
+
+    return property(fget, fset)
+
+
+def _facet_point(name: str) -> property:
+    """Like _facet_column, for a quantized point: reads and writes floats in [0, 1]"""
+    def fget(self):
+        return getattr(self.table, name)[self.idx] / POINT_SCALE
+
+    def fset(self, value):
+        getattr(self.table, name)[self.idx] = quantize_point(value)
+
+    return property(fget, fset)
+
+
+@dataclass(slots=True)
 class CrystalFacet:
-    """A single facet of a crystal"""
-    facet_id: str
-    parent_crystal_id: str
-    role: str
-    content: Any
-    confidence: float = 0.5
-    access_count: int = 0
-    last_accessed: float = field(default_factory=time.time)
-    
+    """A single facet of a crystal: a view onto one FacetTable row"""
+    table: FacetTable = field(repr=False)  # compared by identity: FacetTable has no __eq__
+    idx: int
+
+    facet_id = _facet_column("facet_id")
+    parent_crystal_id = _facet_column("parent_crystal_id")
+    role = _facet_column("role")
+    content = _facet_column("content")
+    confidence = _facet_column("confidence")
+    access_count = _facet_column("access_count")
+    last_accessed = _facet_column("last_accessed")
+
     # --- PERFECTION: Added state for non-destructive decay ---
-    state: FacetState = FacetState.ACTIVE
-    
-    # --- PERFECTION: Your "8 points per facet" ---
-    resonance: float = field(default_factory=lambda: random.uniform(0, 1))
-    sensitivity: float = field(default_factory=lambda: random.uniform(0, 1))
-    abstractness: float = field(default_factory=lambda: random.uniform(0, 1))
-    potential: float = field(default_factory=lambda: random.uniform(0, 1))
-    stability: float = field(default_factory=lambda: random.uniform(0, 1))
-    coherence: float = field(default_factory=lambda: random.uniform(0, 1))
-    complexity: float = field(default_factory=lambda: random.uniform(0, 1))
-    frequency: float = field(default_factory=lambda: random.uniform(0, 1))
-    
-    def strengthen(self, amount: float = 0.1):
+    state = property(
+        lambda self: self.table.state[self.idx],
+        lambda self, value: self.table.set_state(self.idx, value),
+    )
+
+    resonance = _facet_point("resonance")
+    sensitivity = _facet_point("sensitivity")
+    abstractness = _facet_point("abstractness")
+    potential = _facet_point("potential")
+    stability = _facet_point("stability")
+    coherence = _facet_point("coherence")
+    complexity = _facet_point("complexity")
+    frequency = _facet_point("frequency")
+
+    def strengthen(self, amount: float = 0.1, now: Optional[float] = None):
         """Strengthen this facet through use with interdependent physics updates"""
-        self.confidence = min(1.0, self.confidence + amount)
-        self.access_count += 1
-        self.last_accessed = time.time()
-        self.state = FacetState.ACTIVE # Use brings it back from decay
-        
-        # Apply facet interdependence: strengthening affects physics points
-        self._update_interdependent_physics(boost=True)
-    
-    def decay(self, rate: float = 0.01):
-        """Natural decay over time (Ghost Relic system) with interdependent physics"""
-        if self.state == FacetState.RELIC:
-            return # Already a relic
+        self.table.strengthen((self.idx,), amount, now)
 
-        time_since_access = time.time() - self.last_accessed
-        decay_amount = rate * (time_since_access / 60.0)
-        self.confidence = max(0.0, self.confidence - decay_amount)
-        
-        # Apply interdependent physics decay
-        self._update_interdependent_physics(boost=False)
-        
-        # --- PERFECTION: Non-destructive state change ---
-        if self.confidence < 0.3:
-            self.state = FacetState.DECAYING
-        if self.confidence < 0.1:
-            self.state = FacetState.RELIC
-            # The 'role' is preserved forever
-    
-    def _update_interdependent_physics(self, boost: bool):
-        """
-        Facet physics points influence each other:
-        - High coherence boosts stability
-        - High complexity reduces abstractness temporarily  
-        - High potential increases resonance
-        """
-        if boost:
-            # Strengthening creates positive feedback loops
-            if self.coherence > 0.7:
-                self.stability = min(1.0, self.stability + 0.05)
-            if self.potential > 0.7:
-                self.resonance = min(1.0, self.resonance + 0.05)
-            if self.complexity > 0.8:
-                self.abstractness = max(0.0, self.abstractness - 0.03)
-        else:
-            # Decay creates negative feedback
-            if self.stability < 0.3:
-                self.coherence = max(0.0, self.coherence - 0.03)
-            if self.complexity > 0.7:
-                self.frequency = max(0.0, self.frequency - 0.02)
+    def decay(self, rate: float = 0.01, now: Optional[float] = None):
+        """Natural decay over time (Ghost Relic system) with interdependent physics"""
+        self.table.decay((self.idx,), rate, now)
 
     def get_facet_points(self) -> Dict[str, float]:
         """Helper to get all 8 points"""
-        return {
-            "resonance": self.resonance, "sensitivity": self.sensitivity,
-            "abstractness": self.abstractness, "potential": self.potential,
-            "stability": self.stability, "coherence": self.coherence,
-            "complexity": self.complexity, "frequency": self.frequency
-        }
+        return self.table.get_points(self.idx)
 
-@dataclass
+# Evolution criteria per level: (min external facets, min effective uses)
+_EVOLUTION_CRITERIA = {
+    # Evolve to COMPOSITE: 3+ facets, 10+ uses (or less with high impact)
+    CrystalLevel.BASE: (3, 10),
+    # Evolve to FULL_CONCEPT: 5+ facets, 25+ uses
+    CrystalLevel.COMPOSITE: (5, 25),
+    # --- PERFECTION: Your 8-facet QUASI rule with adaptive threshold ---
+    # Evolve to QUASI: 8+ external facets, 50+ uses (accelerated under stress)
+    CrystalLevel.FULL_CONCEPT: (8, 50),
+}
+# Largest contextual impact multiplier check_evolution_criteria can apply
+_MAX_IMPACT_MULTIPLIER = 1.5
+
+@dataclass(slots=True)
 class Crystal:
     """A Crystal - The evolving, conceptual data structure"""
     crystal_id: str
@@ -141,6 +328,7 @@ class Crystal:
     level: CrystalLevel
     
     facets: Dict[str, CrystalFacet] = field(default_factory=dict)
+    table: FacetTable = field(default_factory=FacetTable, repr=False)
     connections: Dict[str, float] = field(default_factory=dict)
     
     usage_count: int = 0
@@ -150,32 +338,60 @@ class Crystal:
     # --- PERFECTION: Type hint for recursive QUASI crystals ---
     internal_layers: List[CrystalRef] = field(default_factory=list)
 
+    # Lookup indexes over facets: role -> facet_id, content -> facet_id
+    _role_index: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _content_index: Dict[Any, str] = field(default_factory=dict, init=False, repr=False)
+    # Facets that are not INTERNAL_LAW_*, whatever their state (evolution criterion)
+    _external_facet_count: int = field(default=0, init=False, repr=False)
+    # Non-relic rows for use(), valid while (table.relic_version, len(facets)) matches
+    _live_rows: List[int] = field(default_factory=list, init=False, repr=False)
+    _live_rows_key: Tuple[int, int] = field(default=(-1, -1), init=False, repr=False)
+    # Lowercased concept, the key CrystalMemorySystem indexes crystals by
+    _concept_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._concept_lower = self.concept.lower()
+
     def add_facet(self, role: str, content: Any, confidence: float = 0.5) -> CrystalFacet:
         """Add a facet to this crystal"""
         
-        # Check for existing facet (by role OR content)
-        for f in self.facets.values():
-            if f.role == role or f.content == content:
-                f.strengthen()
-                return f
+        # Check for existing facet (by role OR content), earliest match wins
+        fid = self._role_index.get(role)
+        try:
+            content_fid = self._content_index.get(content)
+        except TypeError:
+            # Unhashable content can only be found by comparing against every facet
+            content_fid = next(
+                (f.facet_id for f in self.facets.values() if f.content == content), None
+            )
+        if content_fid is not None and (
+            fid is None or self.facets[content_fid].idx < self.facets[fid].idx
+        ):
+            fid = content_fid
+        if fid is not None:
+            f = self.facets[fid]
+            f.strengthen()
+            return f
                 
         facet_id = f"{self.crystal_id}_facet_{len(self.facets)}"
-        facet = CrystalFacet(
-            facet_id=facet_id,
-            parent_crystal_id=self.crystal_id,
-            role=role,
-            content=content,
-            confidence=confidence
-        )
+        row = self.table.append(facet_id, self.crystal_id, role, content, confidence)
+        facet = CrystalFacet(self.table, row)
         self.facets[facet_id] = facet
+        self._role_index.setdefault(role, facet_id)
+        if not role.startswith("INTERNAL_LAW"):
+            self._external_facet_count += 1
+        try:
+            self._content_index.setdefault(content, facet_id)
+        except TypeError:
+            pass # Unhashable content is only found by scanning
         return facet
 
     def get_facet_by_role(self, role: str) -> Optional[CrystalFacet]:
         """Get an active facet by its role"""
-        for facet in self.facets.values():
-            # --- PERFECTION: Only return ACTIVE facets ---
-            if facet.role == role and facet.state == FacetState.ACTIVE:
-                return facet
+        facet = self.facets.get(self._role_index.get(role))
+        # --- PERFECTION: Only return ACTIVE facets ---
+        if facet is not None and facet.state == FacetState.ACTIVE:
+            return facet
         return None
 
     def check_evolution_criteria(self, context_data: Optional[Dict[str, Any]] = None) -> bool:
@@ -183,8 +399,17 @@ class Crystal:
         Check if crystal can evolve to next level with adaptive contextual criteria.
         High-impact scenarios accelerate evolution.
         """
+        criteria = _EVOLUTION_CRITERIA.get(self.level)
+        if criteria is None:
+            return False # QUASI is the top level
+        min_facets, min_usage = criteria
+
+        # Cheap exit: not even the strongest multiplier reaches the usage bar
+        if self.usage_count * _MAX_IMPACT_MULTIPLIER < min_usage:
+            return False
+
         # --- PERFECTION: Count only *external* facets for evolution ---
-        external_facets = [f for f in self.facets.values() if not f.role.startswith("INTERNAL_LAW")]
+        external_facets = self._external_facet_count
         
         # Contextual modifiers
         impact_multiplier = 1.0
@@ -200,21 +425,7 @@ class Crystal:
                 impact_multiplier = 1.2
         
         effective_usage = self.usage_count * impact_multiplier
-        
-        if self.level == CrystalLevel.BASE:
-            # Evolve to COMPOSITE: 3+ facets, 10+ uses (or less with high impact)
-            return len(external_facets) >= 3 and effective_usage >= 10
-        
-        elif self.level == CrystalLevel.COMPOSITE:
-            # Evolve to FULL_CONCEPT: 5+ facets, 25+ uses
-            return len(external_facets) >= 5 and effective_usage >= 25
-        
-        elif self.level == CrystalLevel.FULL_CONCEPT:
-            # --- PERFECTION: Your 8-facet QUASI rule with adaptive threshold ---
-            # Evolve to QUASI: 8+ external facets, 50+ uses (accelerated under stress)
-            return len(external_facets) >= 8 and effective_usage >= 50
-        
-        return False
+        return external_facets >= min_facets and effective_usage >= min_usage
     
     def evolve(self) -> bool:
         """Evolve crystal to next level"""
@@ -229,7 +440,7 @@ class Crystal:
             return True
         elif self.level == CrystalLevel.FULL_CONCEPT:
             self.level = CrystalLevel.QUASI
-            print(f"  ✨ QUASI EVOLUTION: {self.concept} now internalizing physics...")
+            logger.info("  ✨ QUASI EVOLUTION: %s now internalizing physics...", self.concept)
             # --- PERFECTION: Auto-generate the 8 internal law facets ---
             self._generate_internal_laws()
             return True
@@ -270,7 +481,7 @@ class Crystal:
         if self.level != CrystalLevel.QUASI:
             return {"law": "error", "outcome": "negative", "detail": "Not a QUASI crystal"}
         
-        print(f"  🧠 QUASI Self-Governance: '{self.concept}' is governing itself.")
+        logger.debug("  🧠 QUASI Self-Governance: '%s' is governing itself.", self.concept)
         
         # Simple simulation:
         # We find the "strongest" law facet based on the input data
@@ -315,10 +526,10 @@ class Crystal:
         representing a 'thought about a thought'.
         """
         if self.level != CrystalLevel.QUASI:
-            print(f"  ❌ ERROR: Only QUASI crystals can have internal layers.")
+            logger.warning("  ❌ ERROR: Only QUASI crystals can have internal layers.")
             return
         
-        print(f"  🧠 QUASI Recursion: '{self.concept}' is internalizing '{crystal.concept}'.")
+        logger.info("  🧠 QUASI Recursion: '%s' is internalizing '%s'.", self.concept, crystal.concept)
         self.internal_layers.append(crystal)
         # Link this new internal crystal to the "RECURSION" law facet
         recursion_facet = self.get_facet_by_role("INTERNAL_LAW_RECURSION")
@@ -328,23 +539,38 @@ class Crystal:
     def use(self, governance_result: Dict, action: str):
         """Record usage of this crystal, influenced by governance"""
         self.usage_count += 1
-        self.last_used = time.time()
-        
-        # Use governance results to influence facets
-        for facet in self.facets.values():
-            if facet.state == FacetState.RELIC:
-                continue
-            
-            # --- PERFECTION: Your "Energy Law" ---
-            # Data is reallocated, not destroyed
-            if governance_result['outcome'] == 'positive':
-                facet.strengthen(0.05) # Reallocate energy to this facet
-            elif governance_result['outcome'] == 'negative':
-                facet.confidence = max(0.0, facet.confidence - 0.02) # Reallocate energy away
-            
-            # Randomly "flicker" the 8 points on use
-            facet.resonance = max(0.0, min(1.0, facet.resonance + random.uniform(-0.05, 0.05)))
-            facet.stability = max(0.0, min(1.0, facet.stability + random.uniform(-0.05, 0.05)))
+        self.last_used = now = time.time()
+        
+        # Use governance results to influence facets, column by column
+        t = self.table
+        key = (t.relic_version, len(self.facets))
+        if self._live_rows_key != key:
+            state = t.state
+            relic = FacetState.RELIC
+            self._live_rows = [f.idx for f in self.facets.values() if state[f.idx] is not relic]
+            self._live_rows_key = key
+        rows = self._live_rows
+
+        # --- PERFECTION: Your "Energy Law" ---
+        # Data is reallocated, not destroyed
+        outcome = governance_result['outcome']
+        if outcome == 'positive':
+            t.strengthen(rows, 0.05, now) # Reallocate energy to these facets
+        elif outcome == 'negative':
+            confidence = t.confidence
+            for row in rows:
+                confidence[row] = max(0.0, confidence[row] - 0.02) # Reallocate energy away
+
+        # Randomly "flicker" the 8 points on use
+        resonance = t.resonance
+        stability = t.stability
+        draw = t.rng.random
+        top = POINT_SCALE
+        for row in rows:
+            r = resonance[row] + round(_Q_FLICKER * (draw() - 0.5))
+            resonance[row] = 0 if r < 0 else top if r > top else r
+            st = stability[row] + round(_Q_FLICKER * (draw() - 0.5))
+            stability[row] = 0 if st < 0 else top if st > top else st
 
 
 # ============================================================================
@@ -354,14 +580,22 @@ class Crystal:
 class CrystalMemorySystem:
     """Manages the lifecycle of all Crystals"""
     
-    def __init__(self, governance_engine: 'GovernanceEngine'):
+    def __init__(self, governance_engine: 'GovernanceEngine', seed: Optional[int] = None):
         self.crystals: Dict[str, Crystal] = {}
+        self._concept_index: Dict[str, str] = {}  # concept.lower() -> crystal_id
+        # Last concept resolved by get_or_create_crystal (repeat lookups skip lower() + index)
+        self._cache_concept: Optional[str] = None
+        self._cache_crystal: Optional[Crystal] = None
+        # Own RNG stream for facet points and flicker (seed for reproducible runs)
+        self._rng = random.Random(seed)
+        # Facets of every crystal live in this one table, so decay is a single pass
+        self.facet_table = FacetTable(self._rng)
         # --- PERFECTION: System now requires a governance engine ---
         self.governance = governance_engine
         self.total_crystals_created = 0
         self.total_evolutions = 0
         self.level_counts = {level: 0 for level in CrystalLevel}
-        self.pathway_history = defaultdict(int)
+        self.pathway_history = defaultdict(int)  # (lesser concept, greater concept) -> links
         
         # --- NEW: Pattern Recognition System ---
         self.recurring_patterns: Dict[str, int] = {}  # Pattern signature -> count
@@ -373,15 +607,21 @@ class CrystalMemorySystem:
     
     def get_or_create_crystal(self, concept: str, initial_content: Any = None) -> Crystal:
         """Get existing crystal or create new one"""
-        for crystal in self.crystals.values():
-            if crystal.concept.lower() == concept.lower():
-                return crystal
+        if concept == self._cache_concept:
+            return self._cache_crystal
+        key = concept.lower()
+        crystal_id = self._concept_index.get(key)
+        if crystal_id is not None:
+            crystal = self.crystals[crystal_id]
+            self._cache_concept, self._cache_crystal = concept, crystal
+            return crystal
 
         crystal_id = f"crystal_{str(uuid.uuid4())[:8]}"
         crystal = Crystal(
             crystal_id=crystal_id,
             concept=concept,
-            level=CrystalLevel.BASE
+            level=CrystalLevel.BASE,
+            table=self.facet_table
         )
         
         if initial_content:
@@ -391,8 +631,10 @@ class CrystalMemorySystem:
             facet.strengthen(gov_result.get('energy_change', 0.1))
 
         self.crystals[crystal.crystal_id] = crystal
+        self._concept_index[crystal._concept_lower] = crystal.crystal_id
         self.total_crystals_created += 1
         self.level_counts[CrystalLevel.BASE] += 1
+        self._cache_concept, self._cache_crystal = concept, crystal
         return crystal
     
     def use_crystal(self, concept: str, data: Dict) -> Optional[Crystal]:
@@ -438,23 +680,13 @@ class CrystalMemorySystem:
         current2 = crystal2.connections.get(crystal1.crystal_id, 0.0)
         crystal2.connections[crystal1.crystal_id] = min(1.0, current2 + (weight * weight_mod))
 
-        self.pathway_history[tuple(sorted((concept1, concept2)))] += 1
+        # Ordered pair without building a list in sorted(); keeps self-links as (A, A)
+        self.pathway_history[(concept1, concept2) if concept1 <= concept2 else (concept2, concept1)] += 1
         
     def decay_all(self):
-        """DIMENSIONAL: Apply decay to all facets in parallel"""
-        from concurrent.futures import ThreadPoolExecutor
-        
-        # Collect ALL facets from ALL crystals
-        all_facets = []
-        for crystal in self.crystals.values():
-            all_facets.extend(crystal.facets.values())
-        
-        # DIMENSIONAL BATCH DECAY: All facets decay simultaneously
-        def decay_facet(facet):
-            facet.decay(rate=0.005)
-        
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            list(executor.map(decay_facet, all_facets))
+        """DIMENSIONAL: Apply decay to all facets in one pass over the shared table"""
+        t = self.facet_table
+        t.decay(range(len(t)), rate=0.005, now=time.time())
         
         # Pattern detection pass
         if len(self.crystals) > 10:
@@ -462,54 +694,42 @@ class CrystalMemorySystem:
 
     def _detect_recurring_patterns(self):
         """
-        DIMENSIONAL: Analyze ALL crystal patterns in parallel.
+        DIMENSIONAL: Analyze ALL crystal patterns in one pass.
         """
-        from concurrent.futures import ThreadPoolExecutor
-        from collections import defaultdict
-        
-        def analyze_crystal(crystal):
-            """Analyze a single crystal (runs in parallel)"""
-            if len(crystal.connections) < 2:
-                return None
-            
-            connected_concepts = sorted([
-                self.crystals[cid].concept for cid in crystal.connections.keys()
-                if cid in self.crystals
-            ])
-            
-            if len(connected_concepts) >= 2:
-                signature = tuple(connected_concepts[:3])
-                return (signature, crystal.concept)
-            return None
-        
-        # DIMENSIONAL PARALLEL ANALYSIS: All crystals analyzed simultaneously
-        connection_signatures = defaultdict(list)
-        
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            results = list(executor.map(analyze_crystal, self.crystals.values()))
-        
-        # Aggregate results
-        for result in results:
-            if result:
-                sig, concept = result
-                connection_signatures[sig].append(concept)
-            
+        crystals = self.crystals
+        signature_counts: Counter = Counter()
+        signature_sources: Dict[Tuple[str, ...], List[str]] = {}
+        for crystal in crystals.values():
+            cids = crystal.connections
+            if len(cids) < 2:
+                continue
+
+            connected_concepts = sorted(
+                crystals[cid].concept for cid in cids if cid in crystals
+            )
+            if len(connected_concepts) < 2:
+                continue
+
+            signature = tuple(connected_concepts[:3])
+            signature_counts[signature] += 1
+            signature_sources.setdefault(signature, []).append(crystal.concept)
+
         # Find recurring patterns (same signature used by multiple crystals)
-        for signature, concepts in connection_signatures.items():
-            if len(concepts) >= 3:  # Pattern must appear 3+ times
+        for signature, count in signature_counts.items():
+            if count >= 3:  # Pattern must appear 3+ times
                 pattern_key = "_".join(signature)
-                self.recurring_patterns[pattern_key] = len(concepts)
+                self.recurring_patterns[pattern_key] = count
                 
                 # Create abstracted concept if not exists
                 if pattern_key not in self.abstracted_concepts:
-                    self._create_abstracted_concept(pattern_key, concepts, signature)
+                    self._create_abstracted_concept(pattern_key, signature_sources[signature], signature)
     
     def _create_abstracted_concept(self, pattern_key: str, source_concepts: List[str], signature: Tuple):
         """Create generalized concept from recurring pattern"""
         abstract_name = f"ABSTRACT_{pattern_key[:30]}"
         
         # Check if already exists
-        if any(c.concept == abstract_name for c in self.crystals.values()):
+        if abstract_name.lower() in self._concept_index:
             return
         
         abstract_crystal = self.get_or_create_crystal(abstract_name)
@@ -526,7 +746,7 @@ class CrystalMemorySystem:
             self.link_crystals(abstract_name, source, {"is_abstraction": True}, weight=0.3)
         
         self.abstracted_concepts[pattern_key] = source_concepts
-        print(f"[PATTERN] Created abstracted concept: {abstract_name}")
+        logger.info("[PATTERN] Created abstracted concept: %s", abstract_name)
     
     def create_meta_crystal(self, domain: str, managed_crystals: List[str]) -> 'MetaCrystal':
         """
@@ -540,7 +760,7 @@ class CrystalMemorySystem:
         
         meta = MetaCrystal(meta_id, domain, managed_crystals)
         self.meta_crystals[meta_id] = meta
-        print(f"[META] Created meta-crystal '{meta_id}' managing {len(managed_crystals)} crystals")
+        logger.info("[META] Created meta-crystal '%s' managing %d crystals", meta_id, len(managed_crystals))
         return meta
     
     def coordinate_multi_crystal_decision(self, crystals: List[Crystal], data: Dict) -> Dict[str, Any]:
@@ -567,17 +787,14 @@ class CrystalMemorySystem:
             return {"decision": "no_quasi_crystals", "confidence": 0.0}
         
         # Consensus via majority vote on outcome
-        outcome_votes = defaultdict(int)
-        for d in decisions:
-            outcome_votes[d["outcome"]] += 1
-        
-        consensus_outcome = max(outcome_votes, key=outcome_votes.get)
-        confidence = outcome_votes[consensus_outcome] / len(decisions)
+        outcome_votes = Counter(d["outcome"] for d in decisions)
+        consensus_outcome, consensus_votes = outcome_votes.most_common(1)[0]
+        confidence = consensus_votes / len(decisions)
         
         # Average energy change from consensus decisions
         consensus_energy = sum(
             d["energy"] for d in decisions if d["outcome"] == consensus_outcome
-        ) / max(1, outcome_votes[consensus_outcome])
+        ) / consensus_votes
         
         return {
             "decision": consensus_outcome,
@@ -604,7 +821,16 @@ class CrystalMemorySystem:
 # 2.5. META-CRYSTAL COORDINATION SYSTEM
 # ============================================================================
 
-@dataclass
+# Priority matrix: Energy > Consciousness > Governance
+_LAW_PRIORITY = {
+    "QUASI_ENERGY": 3,
+    "QUASI_CONSCIOUSNESS": 2,
+    "QUASI_GOVERNANCE": 1,
+    "QUASI_COLLISION": 2,
+    "QUASI_CHAOS": 0  # Chaos is deprioritized
+}
+
+@dataclass(slots=True)
 class MetaCrystal:
     """
     Executive coordinator that monitors multiple QUASI crystals
@@ -613,7 +839,8 @@ class MetaCrystal:
     meta_id: str
     domain: str
     managed_crystal_ids: List[str] = field(default_factory=list)
-    coordination_history: List[Dict] = field(default_factory=list)
+    # Last 100 coordinations; older entries fall off the left
+    coordination_history: Deque[Dict] = field(default_factory=lambda: deque(maxlen=100))
     
     def add_managed_crystal(self, crystal_id: str):
         """Add a QUASI crystal to management"""
@@ -628,19 +855,10 @@ class MetaCrystal:
         if not crystal_decisions:
             return {"action": "wait", "confidence": 0.0}
         
-        # Priority matrix: Energy > Consciousness > Governance
-        priority_map = {
-            "QUASI_ENERGY": 3,
-            "QUASI_CONSCIOUSNESS": 2,
-            "QUASI_GOVERNANCE": 1,
-            "QUASI_COLLISION": 2,
-            "QUASI_CHAOS": 0  # Chaos is deprioritized
-        }
-        
         # Score each decision
         scored_decisions = []
         for decision in crystal_decisions:
-            priority = priority_map.get(decision.get("law", ""), 1)
+            priority = _LAW_PRIORITY.get(decision.get("law", ""), 1)
             outcome_score = 1.0 if decision.get("outcome") == "positive" else 0.5
             final_score = priority * outcome_score
             scored_decisions.append((final_score, decision))
@@ -656,9 +874,6 @@ class MetaCrystal:
             "outcome": best_decision.get("outcome")
         })
         
-        if len(self.coordination_history) > 100:
-            self.coordination_history.pop(0)
-        
         return {
             "action": best_decision.get("law", "wait"),
             "outcome": best_decision.get("outcome", "neutral"),
@@ -670,20 +885,61 @@ class MetaCrystal:
 # 3. GOVERNANCE ENGINE (From meta_sfo_domain.py)
 # ============================================================================
 
+# Law chosen for non-"use" actions (anything else falls back to ENERGY)
+_ACTION_TO_LAW = {
+    "link": "COLLISION",
+    # Per your Energy Law: Evolving data
+    "add_facet": "ENERGY",
+}
+
+# Per-theme law outcomes: law -> fn(threat, data) -> (outcome, energy_change).
+# Laws missing from a theme's table are neutral.
+_SECURITY_LAW_TABLE = {
+    # Evolving is good
+    "ENERGY": lambda threat, data: ("positive", 0.1),
+    "MOTION": lambda threat, data: ("negative", 0.0) if threat > 0.7 else ("positive", 0.0),
+    # Linking two high-threat crystals is a "negative" collision
+    "COLLISION": lambda threat, data: ("negative", -0.2) if threat > 0.8 else ("positive", 0.1),
+    # Random system spike
+    "CHAOS": lambda threat, data: ("negative", -0.5),
+    # Recognizing pattern is good
+    "CONSCIOUSNESS": lambda threat, data: ("positive", 0.2),
+    "GOVERNANCE": lambda threat, data: (
+        ("negative", 0.0) if data.get('is_false_positive', False) else ("positive", 0.0)
+    ),
+}
+
+_THEME_LAW_TABLES = {
+    "security": _SECURITY_LAW_TABLE,
+}
+
+# CHAOS fires on 10% of external law applications
+_CHAOS_P = 0.1
+_CHAOS_LOG_Q = math.log1p(-_CHAOS_P)
+
 class GovernanceEngine:
     """
     Applies the adaptable "Physics Laws" to data interactions.
     Now featuring Deterministic Physics and QUASI Hand-off.
     """
     
-    def __init__(self, data_theme: str):
+    def __init__(self, data_theme: str, seed: Optional[int] = None):
         self.theme = data_theme
+        self._rng = random.Random(seed)
+        self._chaos_countdown = self._draw_chaos_gap()
         # --- PERFECTION: Added your 8 laws ---
         self.laws = ['ENERGY', 'MOTION', 'COLLISION', 'CHAOS', 'CONSCIOUSNESS', 'GOVERNANCE', 'RECURSION', 'SYMMETRY']
         self.total_laws_applied = 0
         print(f"Governance Engine Initialized. Theme: '{self.theme}'")
         print(f"External Laws ({len(self.laws)}): {', '.join(self.laws)}")
 
+    def _draw_chaos_gap(self) -> int:
+        """
+        Law applications until the next CHAOS trigger. Skips ahead over the
+        10% coin flips with one geometric draw instead of one draw per call.
+        """
+        return int(math.log(1.0 - self._rng.random()) / _CHAOS_LOG_Q)
+
     # --- PERFECTION: Signature changed to be deterministic ---
     def apply_law(self, crystal: Crystal, data: Dict, action: str) -> Dict[str, Any]:
         """
@@ -698,56 +954,30 @@ class GovernanceEngine:
             return crystal.apply_internal_governance(data)
         
         # --- PERFECTION: Deterministic Law Choice (no more random.choice) ---
-        law_to_apply = "ENERGY" # Default
-        
-        if action == "link":
-            law_to_apply = "COLLISION"
-        elif action == "add_facet":
-            # Per your Energy Law: Evolving data
-            law_to_apply = "ENERGY"
-        elif action == "use":
+        if action == "use":
             if data.get('is_new_pattern', False):
                 law_to_apply = "CONSCIOUSNESS" # Recognizing a pattern
             elif data.get('threat_level', 0) > 0.7:
                 law_to_apply = "MOTION" # High motion/activity
             else:
                 law_to_apply = "GOVERNANCE" # Routine check
+        else:
+            law_to_apply = _ACTION_TO_LAW.get(action, "ENERGY")
         
         # Trigger CHAOS law randomly (10% chance) on any action
-        if random.random() < 0.1:
+        if self._chaos_countdown == 0:
             law_to_apply = "CHAOS"
+            self._chaos_countdown = self._draw_chaos_gap()
+        else:
+            self._chaos_countdown -= 1
             
         # --- Apply laws based on THEME ---
         outcome = "neutral"
         energy_change = 0.0
         
-        if self.theme == "security":
-            threat = data.get('threat_level', 0.5)
-            
-            if law_to_apply == "ENERGY":
-                outcome = "positive" # Evolving is good
-                energy_change = 0.1
-                
-            elif law_to_apply == "MOTION":
-                if threat > 0.7: outcome = "negative"
-                else: outcome = "positive"
-            
-            elif law_to_apply == "COLLISION":
-                # Linking two high-threat crystals is a "negative" collision
-                if threat > 0.8: outcome = "negative"; energy_change = -0.2
-                else: outcome = "positive"; energy_change = 0.1
-                    
-            elif law_to_apply == "CHAOS":
-                outcome = "negative" # Random system spike
-                energy_change = -0.5
-                
-            elif law_to_apply == "CONSCIOUSNESS":
-                outcome = "positive" # Recognizing pattern is good
-                energy_change = 0.2
-
-            elif law_to_apply == "GOVERNANCE":
-                if data.get('is_false_positive', False): outcome = "negative"
-                else: outcome = "positive"
+        law_fn = _THEME_LAW_TABLES.get(self.theme, {}).get(law_to_apply)
+        if law_fn is not None:
+            outcome, energy_change = law_fn(data.get('threat_level', 0.5), data)
             
         return {
             "law": law_to_apply,
@@ -806,6 +1036,9 @@ def run_test_simulation(system: CrystalMemorySystem, iterations: int, dataset: L
 # --- PERFECTION: New Test Harness for QUASI Evolution ---
 if __name__ == "__main__":
     
+    # Surface the per-interaction log lines for the demo run
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+    
     # --- 1. Initialize the System Components ---
     
     # The "External Rules"
@@ -19,7 +19,11 @@ from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle, RoundedRectangle, Line
 from kivy.core.window import Window
 import threading
+import queue
+import logging
+import logging.handlers
 import json
+import math
 import os
 
 # Import Trinity system
@@ -49,6 +53,41 @@ COLORS = {
 # Set window background
 Window.clearcolor = COLORS['bg_dark']
 
+# Tier limits
+TIER_LIMITS = {
+    'free': {'conversations': 1000, 'crystals': 100, 'platforms': 1},
+    'pro': {'conversations': 10000, 'crystals': 1000, 'platforms': 3},
+    'lifetime': {'conversations': 10000, 'crystals': 1000, 'platforms': 3},
+    'enterprise': {'conversations': math.inf, 'crystals': math.inf, 'platforms': 3}
+}
+
+# Trinity log records go through a queue; a listener thread does the stream I/O
+class _TrinityLogListener(logging.handlers.QueueListener):
+    """QueueListener whose start()/stop() do nothing if already started/stopped"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._started = False
+    
+    def start(self):
+        if not self._started:
+            super().start()
+            self._started = True
+    
+    def stop(self):
+        if self._started:
+            super().stop()
+            self._started = False
+
+_LOG_QUEUE = queue.Queue(-1)
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter("[Trinity] %(message)s"))
+LOG_LISTENER = _TrinityLogListener(_LOG_QUEUE, _log_stream)
+logger = logging.getLogger("Trinity")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+logger.propagate = False
+
 # ============================================================================
 # TRINITY SYSTEM MANAGER (Thread-Safe)
 # ============================================================================
@@ -64,44 +103,46 @@ class TrinityManager:
         self.merge_thread = None
         self.running = False
         self.user_tier = "free"  # Default tier
-        
-        # Tier limits
-        self.tier_limits = {
-            'free': {'conversations': 1000, 'crystals': 100, 'platforms': 1},
-            'pro': {'conversations': 10000, 'crystals': 1000, 'platforms': 3},
-            'lifetime': {'conversations': 10000, 'crystals': 1000, 'platforms': 3},
-            'enterprise': {'conversations': float('inf'), 'crystals': float('inf'), 'platforms': 3}
-        }
+        self.tier_limits = TIER_LIMITS
     
     def start(self):
         """Initialize Trinity system"""
         if self.running:
             return
         
-        print("[Trinity] Starting system...")
-        
-        # Memory layer
-        self.memory_governor, self.memory_system, self.save_thread, self.merge_thread = start_memory_system()
+        LOG_LISTENER.start()
+        logger.info("Starting system...")
         
-        # Processing layer
-        processing_governance = GovernanceEngine(data_theme="conversation")
-        self.crystal_system = CrystalMemorySystem(governance_engine=processing_governance)
-        
-        # Energy layer
-        self.energy_regulator = DimensionalEnergyRegulator(conservation_limit=50.0, decay_rate=0.1)
+        try:
+            # Memory layer
+            self.memory_governor, self.memory_system, self.save_thread, self.merge_thread = start_memory_system()
+            
+            # Processing layer
+            processing_governance = GovernanceEngine(data_theme="conversation")
+            self.crystal_system = CrystalMemorySystem(governance_engine=processing_governance)
+            
+            # Energy layer
+            self.energy_regulator = DimensionalEnergyRegulator(conservation_limit=50.0, decay_rate=0.1)
+        except Exception:
+            logger.exception("Startup failed")
+            if self.save_thread is not None and self.save_thread.is_alive():
+                stop_memory_system(self.save_thread, self.merge_thread)
+            LOG_LISTENER.stop()
+            raise
         
         self.running = True
-        print("[Trinity] System online")
+        logger.info("System online")
     
     def stop(self):
         """Shutdown Trinity system"""
         if not self.running:
             return
         
-        print("[Trinity] Shutting down...")
+        logger.info("Shutting down...")
         stop_memory_system(self.save_thread, self.merge_thread)
         self.running = False
-        print("[Trinity] System offline")
+        logger.info("System offline")
+        LOG_LISTENER.stop()
     
     def get_stats(self):
         """Get current system statistics"""
@@ -114,7 +155,10 @@ class TrinityManager:
         
         memory_stats = {
             'total_nodes': len(self.memory_system.nodes),
-            'last_save': self.memory_system.last_global_save_timestamp
+            'last_save': self.memory_system.last_global_save_timestamp,
+            'session_platforms': dict(self.memory_system.session_platform_counts),  # since startup only
+            'laws_applied': self.memory_governor.total_laws_applied,
+            'laws_succeeded': self.memory_governor.total_laws_succeeded
         }
         
         crystal_stats = self.crystal_system.get_memory_stats()
@@ -129,42 +173,76 @@ class TrinityManager:
     
     def ingest_conversation(self, conversation_data):
         """Ingest a conversation through Trinity"""
+        return self.ingest_conversations([conversation_data])[0]
+    
+    def ingest_conversations(self, conversations):
+        """
+        Ingest several conversations through Trinity. Each conversation goes
+        through memory and processing in turn; energy updates are collected
+        per facet and applied once, and the energy layer ticks once.
+        Returns one result dict per conversation. A conversation that fails
+        is reported as an error without affecting the others; if the energy
+        update fails, the successful results carry an "energy_error" message.
+        """
         if not self.running:
-            return {"status": "error", "message": "Trinity not running"}
+            return [{"status": "error", "message": "Trinity not running"} for _ in conversations]
         
-        # Check tier limits
-        current_nodes = len(self.memory_system.nodes)
         limit = self.tier_limits[self.user_tier]['conversations']
-        
-        if current_nodes >= limit:
-            return {
-                "status": "limit_reached",
-                "message": f"Reached {self.user_tier.upper()} tier limit ({limit} conversations)",
-                "upgrade_required": True
-            }
-        
-        try:
-            # Memory layer
-            parent_node = self.memory_governor.ingest_data(conversation_data)
+        nodes = self.memory_system.nodes
+        
+        results = []
+        touched_crystals = {}  # crystal_id -> crystal, registered once per batch
+        energy_updates = []  # facet ids to inject, one entry per use
+        for conversation_data in conversations:
+            # Check tier limits (one conversation can write several nodes)
+            if len(nodes) >= limit:
+                results.append({
+                    "status": "limit_reached",
+                    "message": f"Reached {self.user_tier.upper()} tier limit ({limit} conversations)",
+                    "upgrade_required": True
+                })
+                continue
             
-            # Processing layer
-            concept = parent_node.payload.get('concept', 'unknown')
-            crystal = self.crystal_system.use_crystal(concept, conversation_data)
+            try:
+                # Memory layer
+                parent_node = self.memory_governor.ingest_data(conversation_data)
+                if parent_node is None:
+                    results.append({"status": "error", "message": "Memory layer discarded the conversation"})
+                    continue
+                
+                # Processing layer
+                concept = parent_node.payload.get('concept', 'unknown')
+                crystal = self.crystal_system.use_crystal(concept, conversation_data)
+            except Exception as e:
+                logger.exception("Ingest failed")
+                results.append({"status": "error", "message": str(e)})
+                continue
             
-            # Energy layer
-            self.energy_regulator.register_crystal(crystal)
-            for facet_id in crystal.facets.keys():
-                self.energy_regulator.inject_energy(facet_id, 0.5)
-            self.energy_regulator.step()
+            # Energy layer (applied after the loop)
+            touched_crystals[crystal.crystal_id] = crystal
+            energy_updates.extend(crystal.facets.keys())
             
-            return {
+            results.append({
                 "status": "success",
                 "concept": concept,
                 "crystal_level": crystal.level.name,
                 "nodes_created": 1
-            }
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
+            })
+        
+        if touched_crystals:
+            # Memory and processing are already committed; an energy failure
+            # is reported alongside the successes rather than replacing them
+            try:
+                for crystal in touched_crystals.values():
+                    self.energy_regulator.register_crystal(crystal)
+                self.energy_regulator.inject_energy_bulk(energy_updates, 0.5)
+                self.energy_regulator.step()
+            except Exception as e:
+                logger.exception("Energy update failed")
+                for result in results:
+                    if result["status"] == "success":
+                        result["energy_error"] = str(e)
+        return results
 
 # Global Trinity instance
 TRINITY = TrinityManager()
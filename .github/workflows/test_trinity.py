@@ -7,6 +7,7 @@ This script verifies your Trinity modules work correctly.
 
 import sys
 import time
+import uuid
 
 print("="*60)
 print("DIMENSIONAL CORTEX - TRINITY SYSTEM TEST")
@@ -125,6 +126,89 @@ try:
 except Exception as e:
     print(f"⚠ Warning: Stats check failed (non-critical): {e}")
 
+# Test 7: Batch Ingestion
+print("\n[BATCH] Checking batch ingestion...")
+try:
+    from main import TrinityManager, TIER_LIMITS
+except ImportError as e:
+    print(f"⚠ Skipped: app module not importable here ({e})")
+else:
+    try:
+        trinity = TrinityManager()
+        trinity.memory_governor = memory_governor
+        trinity.memory_system = memory_system
+        trinity.crystal_system = crystal_system
+        trinity.energy_regulator = energy_regulator
+        trinity.running = True
+        nodes = memory_system.nodes
+
+        # Unique concepts per run, so state saved by earlier runs is never reused
+        run_tag = uuid.uuid4().hex[:8]
+        def batch_data(tag, count):
+            return [{
+                "platform": "test",
+                "conversation_id": f"{tag}_{run_tag}_{i:03d}",
+                "root_concept": f"{tag.upper()}_{run_tag}_{i}",
+                "json_data": {"status": "testing", "index": i}
+            } for i in range(count)]
+
+        # Tier limit hit mid-batch: ingestion stops once the node count reaches it
+        print("  → Tier limit reached partway through a batch...")
+        limit = len(nodes) + 1
+        trinity.tier_limits = dict(TIER_LIMITS, batch_test={'conversations': limit})
+        trinity.user_tier = 'batch_test'
+        results = trinity.ingest_conversations(batch_data("limit", 3))
+        statuses = [r["status"] for r in results]
+        accepted = statuses.count("success")
+        assert accepted >= 1, statuses
+        assert statuses == ["success"] * accepted + ["limit_reached"] * (3 - accepted), statuses
+        assert len(nodes) >= limit, (len(nodes), limit)
+        print("  ✓ Conversations past the limit were refused")
+
+        # A processing failure only fails its own conversation
+        print("  → Processing layer raising partway through a batch...")
+        trinity.user_tier = 'enterprise'
+        use_crystal = crystal_system.use_crystal
+        failing_id = f"raise_{run_tag}_001"
+        def failing_use_crystal(concept, data):
+            if data["conversation_id"] == failing_id:
+                raise RuntimeError("processing failure")
+            return use_crystal(concept, data)
+        crystal_system.use_crystal = failing_use_crystal
+        nodes_before = len(nodes)
+        try:
+            results = trinity.ingest_conversations(batch_data("raise", 3))
+        finally:
+            crystal_system.use_crystal = use_crystal
+        statuses = [r["status"] for r in results]
+        assert statuses == ["success", "error", "success"], statuses
+        assert results[1] is not results[0] and "processing failure" in results[1]["message"]
+        assert len(nodes) > nodes_before, "Committed conversations were not written"
+        print("  ✓ Only the failing conversation was reported as an error")
+
+        # An energy failure leaves the committed conversations as successes
+        print("  → Energy layer raising after the batch...")
+        step = energy_regulator.step
+        def failing_step():
+            raise RuntimeError("energy failure")
+        energy_regulator.step = failing_step
+        try:
+            results = trinity.ingest_conversations(batch_data("energy", 2))
+        finally:
+            energy_regulator.step = step
+        assert all(r["status"] == "success" for r in results), results
+        assert all("energy failure" in r["energy_error"] for r in results), results
+        print("  ✓ Successful conversations kept their status")
+
+        print("✓ Batch ingestion behaves correctly")
+    except Exception as e:
+        print(f"✗ FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        # The save and merge threads keep the process alive until stopped
+        stop_memory_system(save_thread, merge_thread)
+        sys.exit(1)
+
 # Cleanup
 print("\n[CLEANUP] Shutting down Trinity system...")
 try:
@@ -2,19 +2,23 @@
 """
 Dimensional Energy Regulation System (MOBILE - PURE PYTHON)
 ============================================================================
-ZERO sequential for-loops in hot paths.
-ALL operations are vectorized batch processing or parallel threaded.
+Hot paths are plain Python loops over flat ``array`` columns (one energy
+buffer, CSR link arrays) rather than per-facet objects. Everything runs
+on the calling thread.
 
-This module is 100% dimensional batch processing - NUMPY FREE for buildozer.
+This module is NUMPY FREE for buildozer.
 """
 
 import math
 import time
+import heapq
 import random
 import threading
+from array import array
+from collections import deque
+from operator import mul
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Tuple, Optional
 
 # ============================================================================
 # 1. HELPER FUNCTIONS & CONFIG
@@ -24,14 +28,169 @@ def sigmoid(x: float, k: float = 10.0, x0: float = 0.5) -> float:
     """Sigmoid mapping for normalized arousal (0.0 to 1.0)."""
     return 1.0 / (1.0 + math.exp(-k * (x - x0)))
 
-@dataclass
+@dataclass(slots=True)
 class PersonalityProfile:
-    """Long-term personality biases that color emotional responses."""
+    """
+    Long-term personality biases that color emotional responses.
+    Every trait assignment bumps ``version`` so regulators know to refresh
+    their cached bias tables.
+    """
     openness: float = 0.5
     conscientiousness: float = 0.5
     extraversion: float = 0.5
     agreeableness: float = 0.5
     neuroticism: float = 0.5
+    version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name != "version":
+            object.__setattr__(self, "version", getattr(self, "version", 0) + 1)
+
+def _no_points() -> Dict[str, float]:
+    return {}
+
+# Canonical order of the 8 facet points; every point vector uses it
+POINT_KEYS = ('resonance', 'sensitivity', 'abstractness', 'potential',
+              'stability', 'coherence', 'complexity', 'frequency')
+_POINT_KEY_SET = frozenset(POINT_KEYS)
+
+def point_schema(points: Dict[str, float]) -> Optional[Tuple[str, ...]]:
+    """
+    Key order for a facet's point vector: POINT_KEYS for the standard 8-point
+    facets, sorted keys for any other schema, None if the facet has no points.
+    Facets only link to facets with the same schema.
+    """
+    if points.keys() == _POINT_KEY_SET:
+        return POINT_KEYS
+    return tuple(sorted(points)) if points else None
+
+def point_vector(points: Dict[str, float], schema: Tuple[str, ...] = POINT_KEYS) -> array:
+    """float32 points in ``schema`` order."""
+    return array('f', [points[k] for k in schema])
+
+class FacetView:
+    """
+    Registration-time view of a facet: its buffer row plus pre-bound accessors,
+    so hot paths skip getattr/hasattr with defaults on every tick. Also caches
+    the point schema, vector and norm for link scoring. They are refreshed when
+    the facet is registered or its own links are recomputed; as a link
+    candidate for other facets it is scored with the cached values.
+    """
+    __slots__ = ('facet_id', 'facet', 'row', 'get_points', 'has_emotion_state',
+                 'schema', 'vec', 'norm')
+
+    def __init__(self, facet_id: str, facet: Any, row: int):
+        self.facet_id = facet_id
+        self.facet = facet
+        self.row = row
+        self.get_points = getattr(facet, "get_facet_points", _no_points)
+        self.has_emotion_state = hasattr(facet, "emotion_state")
+        self.refresh()
+
+    def refresh(self):
+        """Re-reads the facet's points into the cached schema, vector and norm."""
+        points = self.get_points()
+        schema = point_schema(points)
+        vec = point_vector(points, schema) if schema is not None else None
+        self.schema = schema
+        self.vec = vec
+        self.norm = math.sqrt(sum(map(mul, vec, vec))) + 1e-12 if vec is not None else 0.0
+
+@dataclass(frozen=True)
+class LinkSnapshot:
+    """
+    Immutable view of the link graph, published by pointer swap (RCU-style).
+    csr_* is the adjacency (row = source, cols = targets) and rows maps each
+    source buffer row to its (target rows, weights).
+    """
+    links: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    rows: Dict[int, Tuple[array, array]] = field(default_factory=dict)
+    csr_indptr: array = field(default_factory=lambda: array('l', [0]))
+    csr_indices: array = field(default_factory=lambda: array('l'))
+    csr_data: array = field(default_factory=lambda: array('f'))
+
+# Plutchik primaries in score-column order; ties resolve to the earliest column.
+PLUTCHIK_EMOTIONS = ('joy', 'trust', 'fear', 'surprise', 'sadness', 'disgust', 'anger', 'anticipation')
+
+# Personality bias per Plutchik column as parallel tables:
+# intensity_bias = 1 + BIAS_DIR[e] * (personality_vec[BIAS_TRAIT[e]] - 0.5) * BIAS_W[e]
+PERSONALITY_TRAITS = ('openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism')
+#            joy   trust  fear  surprise sadness disgust anger anticipation
+BIAS_TRAIT = (2,    3,     4,    0,       4,      4,      4,    0)
+BIAS_W     = (0.3,  0.25,  0.4,  0.0,     0.4,    0.3,    0.3,  0.2)
+BIAS_DIR   = (1,    1,     -1,   0,       -1,     -1,     -1,   1)
+
+def plutchik_primary_indices(valence: List[float], arousal: List[float], potential: List[float],
+                             stability: List[float], low_stability: List[bool],
+                             high_complexity: List[bool]) -> List[int]:
+    """
+    Column kernel for dynamic Plutchik mapping: builds the (N, 8) score matrix
+    one emotion column at a time and returns the argmax column for each row.
+    """
+    pos = [v > 0 for v in valence]
+    neg_v = [0.0 if p else abs(v) for p, v in zip(pos, valence)]
+    
+    joy = [v * a if p else 0.0 for p, v, a in zip(pos, valence, arousal)]
+    trust = [(v * (1 - a) if p else 0.0) + ((0.3 - a) * 2 if a < 0.3 else 0.0)
+             for p, v, a in zip(pos, valence, arousal)]
+    fear = [nv * a * (1 - pot) + (0.3 if low else 0.0)
+            for nv, a, pot, low in zip(neg_v, arousal, potential, low_stability)]
+    surprise = [(a - 0.6) * 2 if a > 0.6 else 0.0 for a in arousal]
+    sadness = [nv * (1 - a) for nv, a in zip(neg_v, arousal)]
+    disgust = [nv * (1 - a) * stab for nv, a, stab in zip(neg_v, arousal, stability)]
+    anger = [nv * a * pot for nv, a, pot in zip(neg_v, arousal, potential)]
+    anticipation = [(v * 0.5 if p else 0.0) + (0.3 if high else 0.0)
+                    for p, v, high in zip(pos, valence, high_complexity)]
+    
+    columns = range(len(PLUTCHIK_EMOTIONS))
+    return [
+        max(columns, key=row.__getitem__)
+        for row in zip(joy, trust, fear, surprise, sadness, disgust, anger, anticipation)
+    ]
+
+def physics_tick(energy: array, incoming: array, indptr: array, indices: array,
+                 data: array, decay_factor: float, dispersal: float, budget: float):
+    """
+    In-place tick kernel over the SoA energy buffer, as per-facet loops:
+    1. dispersal: each active row (energy > 0.1) gives up ``dispersal`` of
+       its energy in place and scatters it into the ``incoming`` scratch
+       column along its CSR links (rows past ``indptr`` have no links yet),
+       O(active * top_k) rather than O(nnz);
+    2. combine: incoming is folded into the buffer (floored at 0, scratch
+       zeroed for the next tick) while summing the total;
+    3. decay + budget + clip: one multiplier, decay * min(1, budget /
+       decayed_total), written back to each row, zeroing rows below 0.001.
+       A decay factor below 0 (large dt) is clamped to 0, zeroing every row.
+    ``energy`` and ``incoming`` are the regulator's persistent columns;
+    nothing is allocated per tick.
+    """
+    decay_factor = max(decay_factor, 0.0)
+    n = len(energy)
+    if dispersal:
+        linked = len(indptr) - 1
+        for src in range(n):
+            e = energy[src]
+            if e > 0.1:
+                out = e * dispersal
+                energy[src] = e - out
+                if src < linked:
+                    for k in range(indptr[src], indptr[src + 1]):
+                        incoming[indices[k]] += out * data[k]
+
+    total = 0.0
+    for i in range(n):
+        x = energy[i] + incoming[i]
+        incoming[i] = 0.0
+        if x < 0.0:
+            x = 0.0
+        energy[i] = x
+        total += x
+
+    scale = decay_factor * min(1.0, budget / (decay_factor * total + 1e-9))
+    for i in range(n):
+        x = energy[i] * scale
+        energy[i] = x if x >= 0.001 else 0.0
 
 # ============================================================================
 # 2. THE FULLY DIMENSIONAL ENERGY REGULATOR (NUMPY-FREE)
@@ -39,22 +198,33 @@ class PersonalityProfile:
 
 class DimensionalEnergyRegulator:
     """
-    The physics engine with ZERO sequential loops in processing paths.
-    100% dimensional batch operations - PURE PYTHON for mobile.
+    The physics engine - PURE PYTHON for mobile. Facet energy lives in one
+    flat array; step() runs its per-facet work as loops over that buffer.
     """
     
-    def __init__(self, conservation_limit: float = 25.0, decay_rate: float = 0.15):
+    def __init__(self, conservation_limit: float = 25.0, decay_rate: float = 0.15,
+                 seed: Optional[int] = None):
         # --- Core Physics State ---
-        self.facet_energy: Dict[str, float] = {}
-        self.facet_to_facet_links: Dict[str, Dict[str, float]] = {}
+        # SoA energy buffer: one persistent contiguous array indexed by the row
+        # assigned to each facet id, with a parallel list of ids for display.
+        # Stored as float32; arithmetic and totals still run in double.
+        self._fid_index: Dict[str, int] = {}
+        self._fids: List[str] = []
+        self._energy = array('f')
+        # Dispersal scratch column (same rows), zeroed by physics_tick each tick
+        self._incoming = array('d')
+        # Link graph: readers grab the current snapshot without locking; writers
+        # build a new one under _writer_lock and publish it with one assignment.
+        self._link_snapshot = LinkSnapshot()
         self.registered_facets: Dict[str, Any] = {}
+        self._views: Dict[str, FacetView] = {}
         self.total_energy_budget = conservation_limit
         self.base_decay_rate = decay_rate
         
         # --- Thread Safety ---
         self._energy_lock = threading.RLock()
         self._facet_lock = threading.RLock()
-        self._link_lock = threading.RLock()
+        self._writer_lock = threading.Lock()
         
         # --- Integrated Temporal & Personality State ---
         self.personality = PersonalityProfile()
@@ -68,12 +238,12 @@ class DimensionalEnergyRegulator:
         # --- Emotional Momentum & Persistence ---
         self.emotional_momentum: Dict[str, Dict[str, float]] = {}
         self.global_emotional_state = {"primary": "neutral", "intensity": 0.0}
-        self.emotional_history: List[Dict] = []
+        self.emotional_history: deque = deque(maxlen=10)
         
         # --- Temporal Resonance Momentum ---
         self.presence_velocity = 0.0
         self.presence_acceleration = 0.0
-        self.presence_history: List[float] = []
+        self.presence_history: deque = deque(maxlen=5)
         
         # --- Vector Energy Spectrum ---
         self.facet_energy_vector: Dict[str, Dict[str, float]] = {}
@@ -83,9 +253,53 @@ class DimensionalEnergyRegulator:
         self.curiosity_enabled = True
         self.underexplored_threshold = 0.3
         self.curiosity_injection_rate = 0.05
+        # Per-instance RNG: no shared module-level random state between regulators
+        self._rng = random.Random(seed)
         
         print(f"[INIT] FULLY DIMENSIONAL Energy Regulator Online (Mobile/Pure Python)")
 
+    @property
+    def personality(self) -> PersonalityProfile:
+        return self._personality
+
+    @personality.setter
+    def personality(self, profile: PersonalityProfile):
+        """Swaps the profile and refreshes the cached trait vector and bias table."""
+        self._personality = profile
+        self._refresh_personality()
+
+    def _refresh_personality(self):
+        """Rebuilds the trait vector and bias table from the current profile."""
+        profile = self._personality
+        self._personality_version = profile.version
+        self._personality_vec = tuple(getattr(profile, trait) for trait in PERSONALITY_TRAITS)
+        self._bias_by_emotion = tuple(
+            1.0 + direction * (self._personality_vec[trait] - 0.5) * weight
+            for trait, weight, direction in zip(BIAS_TRAIT, BIAS_W, BIAS_DIR)
+        )
+
+    @property
+    def facet_to_facet_links(self) -> Dict[str, Dict[str, float]]:
+        """{facet_id: {linked_id: weight}} from the current link snapshot."""
+        return self._link_snapshot.links
+
+    @property
+    def facet_energy(self) -> Dict[str, float]:
+        """Read-only {facet_id: energy} view, materialized only when asked for."""
+        with self._energy_lock:
+            return dict(zip(self._fids, self._energy))
+
+    def _slot(self, facet_id: str, initial: float = 0.0) -> int:
+        """Returns the buffer row for facet_id, appending a new row if unseen (registration only)."""
+        idx = self._fid_index.get(facet_id)
+        if idx is None:
+            idx = len(self._fids)
+            self._fid_index[facet_id] = idx
+            self._fids.append(facet_id)
+            self._energy.append(initial)
+            self._incoming.append(0.0)
+        return idx
+
     # ------------------------------------------------------------------------
     # FACET REGISTRATION & LINKING (Minimal loops, only for setup)
     # ------------------------------------------------------------------------
@@ -94,58 +308,65 @@ class DimensionalEnergyRegulator:
         fid = getattr(facet_obj, "facet_id", None)
         if not fid: raise ValueError("Facet object must have facet_id attribute")
         
+        with self._energy_lock:
+            row = self._fid_index.get(fid)
+            if row is None:
+                row = self._slot(fid, getattr(facet_obj, "confidence", 0.5) * 0.01)
+        
         with self._facet_lock:
             self.registered_facets[fid] = facet_obj
-            
-        with self._energy_lock:
-            if fid not in self.facet_energy:
-                self.facet_energy[fid] = getattr(facet_obj, "confidence", 0.5) * 0.01
+            self._views[fid] = FacetView(fid, facet_obj, row)
                 
         self._update_links_for_facet(fid)
 
     def register_crystal(self, crystal_obj: Any):
         """Registers all facets of a crystal - BATCH operation."""
-        facets = list(getattr(crystal_obj, "facets", {}).values())
-        
-        # DIMENSIONAL: Register all facets in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            list(executor.map(self.register_facet, facets))
+        # Single pass: registration is pure Python under the GIL, so a thread
+        # pool only added startup cost and lock contention.
+        for facet in list(getattr(crystal_obj, "facets", {}).values()):
+            self.register_facet(facet)
 
     def _update_links_for_facet(self, facet_id: str, top_k: int = 8):
-        """Recalculates 8-point dimensional resonance links (pure Python vectorized)."""
+        """
+        Recalculates dimensional resonance links (pure Python, one loop over the
+        cached vectors). Only facet_id's own vector is re-read; candidates are
+        scored with the vectors cached at their last registration or link update.
+        """
         with self._facet_lock:
-            if facet_id not in self.registered_facets:
+            src_view = self._views.get(facet_id)
+            if src_view is None:
                 return
-            src = self.registered_facets[facet_id]
-            src_points = getattr(src, "get_facet_points", lambda: {})()
+            src_view.refresh()
+            src_values = src_view.vec
             
-            if not src_points:
+            if src_values is None:
                 return
             
             # DIMENSIONAL: Pure Python similarity computation
-            src_keys = list(src_points.keys())
-            src_values = [src_points[k] for k in src_keys]
-            src_mag = math.sqrt(sum(v*v for v in src_values)) + 1e-12
+            src_mag = src_view.norm
+            
+            # Stack the cached vectors of all other facets with the same schema
+            # (rows of M, in schema order)
+            schema = src_view.schema
+            candidate_ids = []
+            rows = []
+            norms = []
+            for other_id, other in self._views.items():
+                if other_id == facet_id or other.schema != schema: continue
+                candidate_ids.append(other_id)
+                rows.append(other.vec)
+                norms.append(other.norm)
+            
+            # Cosine similarity for every row in one matvec-style pass:
+            # (M @ src) / (|M_i| * |src|)
+            scores = [
+                sum(map(mul, row, src_values)) / (src_mag * norm)
+                for row, norm in zip(rows, norms)
+            ]
             
             similarities = []
             facet_ids = []
-            
-            # Build vectors for all other facets
-            for other_id, other in self.registered_facets.items():
-                if other_id == facet_id: continue
-                other_points = getattr(other, "get_facet_points", lambda: {})()
-                
-                # Check if keys match
-                if set(other_points.keys()) != set(src_keys):
-                    continue
-                
-                other_values = [other_points[k] for k in src_keys]
-                other_mag = math.sqrt(sum(v*v for v in other_values)) + 1e-12
-                
-                # Cosine similarity (dot product / magnitudes)
-                dot_product = sum(s*o for s, o in zip(src_values, other_values))
-                score = dot_product / (src_mag * other_mag)
-                
+            for other_id, score in zip(candidate_ids, scores):
                 if score > 0.1:
                     similarities.append(score)
                     facet_ids.append(other_id)
@@ -153,51 +374,99 @@ class DimensionalEnergyRegulator:
             if not similarities:
                 return
             
-            # Get top_k by sorting
-            indexed_sims = list(enumerate(similarities))
-            indexed_sims.sort(key=lambda x: x[1], reverse=True)
-            top_indices = [idx for idx, _ in indexed_sims[:top_k]]
+            # Partial top_k selection (O(N log top_k)), highest score first
+            top_indices = heapq.nlargest(top_k, range(len(similarities)), key=similarities.__getitem__)
             
             total_score = sum(similarities[i] for i in top_indices) + 1e-12
             
-        with self._link_lock:
-            self.facet_to_facet_links[facet_id] = {
-                facet_ids[i]: similarities[i] / total_score
-                for i in top_indices
-            }
+            # Every registered facet already owns a buffer row
+            views = self._views
+            src_idx = views[facet_id].row
+            target_rows = array('l', [views[facet_ids[i]].row for i in top_indices])
+            
+        weights = array('f', [similarities[i] / total_score for i in top_indices])
+            
+        # Copy-on-write: never mutate a published snapshot
+        with self._writer_lock:
+            snap = self._link_snapshot
+            links = dict(snap.links)
+            links[facet_id] = dict(zip((facet_ids[i] for i in top_indices), weights))
+            rows = dict(snap.rows)
+            rows[src_idx] = (target_rows, weights)
+            self._link_snapshot = self._build_link_snapshot(links, rows)
+
+    def _build_link_snapshot(self, links: Dict[str, Dict[str, float]],
+                             rows: Dict[int, Tuple[array, array]]) -> LinkSnapshot:
+        """Builds a new snapshot, including the CSR adjacency."""
+        indptr = array('l', [0])
+        indices = array('l')
+        data = array('f')
+        no_links = ((), ())
+        for src_idx in range(len(self._fids)):
+            target_rows, weights = rows.get(src_idx, no_links)
+            indices.extend(target_rows)
+            data.extend(weights)
+            indptr.append(len(indices))
+        
+        return LinkSnapshot(links, rows, indptr, indices, data)
 
     # ------------------------------------------------------------------------
     # DIMENSIONAL PHYSICS ENGINE (100% Batch Operations - Pure Python)
     # ------------------------------------------------------------------------
     def inject_energy(self, facet_id: str, amount: float):
-        """Injects energy, dampened if the system is 'dissociated' (thread-safe)."""
+        """
+        Injects energy, dampened if the system is 'dissociated' (thread-safe).
+        Raises KeyError for a facet_id that was never registered.
+        """
+        effective_amount = amount * (0.3 + 0.7 * self.current_presence_scale)
+        with self._energy_lock:
+            self._energy[self._fid_index[facet_id]] += effective_amount
+
+    def inject_energy_bulk(self, facet_ids: Iterable[str], amount: float):
+        """
+        BATCH inject_energy: one presence scaling and one lock for all facets.
+        A facet listed k times receives k * amount. Raises KeyError (before any
+        energy moves) if a facet_id was never registered.
+        """
         effective_amount = amount * (0.3 + 0.7 * self.current_presence_scale)
         with self._energy_lock:
-            self.facet_energy.setdefault(facet_id, 0.0)
-            self.facet_energy[facet_id] += effective_amount
+            fid_index = self._fid_index
+            rows = [fid_index[fid] for fid in facet_ids]
+            energy = self._energy
+            for row in rows:
+                energy[row] += effective_amount
 
     def disperse_from(self, source_facet_id: str, fraction: float = 0.3):
-        """Standard dimensional energy ripple with presence-based resistance."""
+        """
+        Standard dimensional energy ripple with presence-based resistance.
+        Raises KeyError for a facet_id that was never registered.
+        """
+        snap = self._link_snapshot
         with self._energy_lock:
-            src_energy = self.facet_energy.get(source_facet_id, 0)
+            src_idx = self._fid_index[source_facet_id]
+            energy = self._energy
+            src_energy = energy[src_idx]
             if src_energy <= 0.01: return
             
             effective_fraction = fraction * self.current_presence_scale
             outgoing = src_energy * effective_fraction
             
-        with self._link_lock:
-            links = self.facet_to_facet_links.get(source_facet_id, {}).copy()
-            
-        with self._energy_lock:
-            # DIMENSIONAL: Vectorized link update
-            for other_id, weight in links.items():
-                self.facet_energy[other_id] = self.facet_energy.get(other_id, 0.0) + (outgoing * weight)
-            self.facet_energy[source_facet_id] -= outgoing
+            # DIMENSIONAL: Scatter along the source row's cached targets
+            target_rows, weights = snap.rows.get(src_idx, ((), ()))
+            for target_idx, weight in zip(target_rows, weights):
+                energy[target_idx] += outgoing * weight
+            energy[src_idx] -= outgoing
 
     def step(self, dt: float = 1.0):
         """
-        FULLY DIMENSIONAL PHYSICS TICK:
-        NO sequential loops - all operations are vectorized or parallel.
+        One physics tick, in order:
+        1. presence: temporal stability, then coherence from one mean/variance
+           pass over the energy buffer;
+        2. physics_tick: dispersal -> decay + budget -> clip, each a loop over
+           the facet rows;
+        3. optional curiosity injection, rescaled again if it pushes the total
+           past the budget;
+        4. emotional resonance and one columnar emotion pass over all facets.
         """
         # --- 1. AUTONOMIC PRESENCE MONITORING ---
         now = time.time()
@@ -212,8 +481,8 @@ class DimensionalEnergyRegulator:
 
         # DIMENSIONAL: Pure Python coherence calculation
         with self._energy_lock:
-            if self.facet_energy:
-                energies = list(self.facet_energy.values())
+            if self._fids:
+                energies = self._energy
                 avg_e = sum(energies) / len(energies)
                 variance = sum((e - avg_e)**2 for e in energies) / len(energies)
                 coherence_score = 1 / (1 + math.exp(-10*(variance-0.05)))
@@ -226,9 +495,7 @@ class DimensionalEnergyRegulator:
         self.current_presence_scale = (self.temporal_stability * 0.6) + (self.emotional_coherence * 0.4)
         
         # Temporal momentum tracking
-        self.presence_history.append(self.current_presence_scale)
-        if len(self.presence_history) > 5:
-            self.presence_history.pop(0)
+        self.presence_history.append(self.current_presence_scale)  # ring buffer, maxlen=5
         
         if len(self.presence_history) >= 2:
             self.presence_velocity = self.presence_history[-1] - self.presence_history[-2]
@@ -240,195 +507,143 @@ class DimensionalEnergyRegulator:
         # --- 2. DIMENSIONAL BATCH PHYSICS ---
         current_decay = self.base_decay_rate * (0.2 + 0.8 * self.current_presence_scale**1.5)
         
+        # DIMENSIONAL TICK: in place on the persistent energy buffer - CSR
+        # dispersal, then decay + budget + clip. Dispersal runs before decay.
+        snap = self._link_snapshot
         with self._energy_lock:
-            # DIMENSIONAL DECAY: Pure Python batch operation
-            fids = list(self.facet_energy.keys())
-            if fids:
-                decay_factor = 1.0 - current_decay * dt
-                # Apply decay to ALL facets simultaneously
-                for fid in fids:
-                    self.facet_energy[fid] *= decay_factor
-                    if self.facet_energy[fid] < 0.001:
-                        self.facet_energy[fid] = 0.0
-        
-        # DIMENSIONAL DISPERSAL: Build adjacency matrix and compute all flows at once
-        self._batch_dispersal(dt)
+            if self._fids:
+                dispersal = 0.3 * self.current_presence_scale if snap.links else 0.0
+                physics_tick(
+                    self._energy, self._incoming, snap.csr_indptr, snap.csr_indices,
+                    snap.csr_data, 1.0 - current_decay * dt, dispersal,
+                    self.total_energy_budget
+                )
         
-        # Curiosity injection
-        if self.curiosity_enabled and random.random() < 0.1:
+        # Curiosity injection, then re-check the budget the tick enforced
+        if self.curiosity_enabled and self._rng.random() < 0.1:
             self._inject_curiosity_energy()
+            with self._energy_lock:
+                energy = self._energy
+                total = sum(energy)
+                if total > self.total_energy_budget:
+                    scale = self.total_energy_budget / total
+                    for i in range(len(energy)):
+                        energy[i] *= scale
 
-        # Budget enforcement (vectorized)
-        with self._energy_lock:
-            if self.facet_energy:
-                total_energy = sum(self.facet_energy.values()) + 1e-9
-                if total_energy > self.total_energy_budget:
-                    scale = self.total_energy_budget / total_energy
-                    # DIMENSIONAL: Scale all energies simultaneously
-                    for fid in self.facet_energy.keys():
-                        self.facet_energy[fid] *= scale
-
-        # --- 3. DIMENSIONAL EMOTIONAL UPDATES (Parallel) ---
+        # --- 3. DIMENSIONAL EMOTIONAL UPDATES ---
         self._update_emotional_resonance()
         self._batch_update_emotions()
 
-    def _batch_dispersal(self, dt: float):
-        """
-        DIMENSIONAL DISPERSAL: Pure Python batch energy flow computation.
-        All facets disperse simultaneously via adjacency logic.
-        """
-        with self._energy_lock, self._link_lock:
-            if not self.facet_energy or not self.facet_to_facet_links:
-                return
-            
-            fids = list(self.facet_energy.keys())
-            fid_to_idx = {fid: i for i, fid in enumerate(fids)}
-            
-            # Build adjacency structure (dict of dicts)
-            adjacency = {}
-            for source_fid, targets in self.facet_to_facet_links.items():
-                if source_fid not in fid_to_idx:
-                    continue
-                adjacency[source_fid] = {}
-                for target_fid, weight in targets.items():
-                    if target_fid in fid_to_idx:
-                        adjacency[source_fid][target_fid] = weight
-            
-            # Energy values
-            energy_dict = {fid: self.facet_energy[fid] for fid in fids}
-            
-            # Compute outgoing energy
-            effective_dispersal = 0.3 * self.current_presence_scale
-            outgoing_dict = {}
-            for fid in fids:
-                if energy_dict[fid] > 0.1:
-                    outgoing_dict[fid] = energy_dict[fid] * effective_dispersal
-                else:
-                    outgoing_dict[fid] = 0.0
-            
-            # Compute incoming energy
-            incoming_dict = {fid: 0.0 for fid in fids}
-            for source_fid, targets in adjacency.items():
-                outgoing = outgoing_dict.get(source_fid, 0.0)
-                for target_fid, weight in targets.items():
-                    incoming_dict[target_fid] += outgoing * weight
-            
-            # Update all energies simultaneously
-            for fid in fids:
-                new_energy = energy_dict[fid] - outgoing_dict[fid] + incoming_dict[fid]
-                self.facet_energy[fid] = max(0.0, new_energy)
-
     def _batch_update_emotions(self):
         """
-        DIMENSIONAL EMOTION UPDATE: Parallel processing of all facet emotions.
-        NO sequential loops - uses ThreadPool for true parallelism.
+        DIMENSIONAL EMOTION UPDATE: One columnar pass over all facet emotions.
+        Inputs are gathered into columns and valence/arousal computed in bulk.
         """
         with self._facet_lock, self._energy_lock:
-            facets_to_process = list(self.registered_facets.items())
+            views = list(self._views.values())
+            energy = self._energy
+            energies = [energy[view.row] for view in views]
         
-        if not facets_to_process:
+        if not views:
             return
         
-        def update_single_emotion(fid_facet_tuple):
-            fid, facet = fid_facet_tuple
-            self._update_facet_emotion(fid, facet)
+        # DIMENSIONAL: Gather point columns, then valence/arousal in one shot
+        points = [view.get_points() for view in views]
+        valences = [
+            max(-1.0, min(1.0, (p.get("coherence", 0.5) * 0.4 + p.get("stability", 0.5) * 0.4)
+                               - (p.get("complexity", 0.5) * 0.2)))
+            for p in points
+        ]
+        # sigmoid(e, k=4.0, x0=1.5) inlined with a bound exp: same values, no per-row call
+        exp = math.exp
+        arousals = [1.0 / (1.0 + exp(-4.0 * (e - 1.5))) for e in energies]
+        primaries = plutchik_primary_indices(
+            valences, arousals,
+            [p.get("potential", 0.5) for p in points],
+            [p.get("stability", 0.5) for p in points],
+            [p.get("stability", 0) < 0.3 for p in points],
+            [p.get("complexity", 0) > 0.7 for p in points],
+        )
+        
+        # Personality bias (cached per profile) and momentum depend only on the
+        # emotion, so they are resolved per emotion instead of once per facet
+        if self._personality.version != self._personality_version:
+            self._refresh_personality()
+        bias_by_emotion = self._bias_by_emotion
+        history = self.emotional_history
+        recent_primary = [history[i]["primary"] for i in range(-min(3, len(history)), 0)]
+        momentum_by_emotion = [
+            0.15 if recent_primary.count(name) >= 2 else 0.0
+            for name in PLUTCHIK_EMOTIONS
+        ]
         
-        # DIMENSIONAL: All emotions computed in parallel
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            list(executor.map(update_single_emotion, facets_to_process))
+        
+        # DIMENSIONAL: Whole-column intensity from the per-emotion tables
+        intensities = [
+            min(1.0, a * bias_by_emotion[e] + momentum_by_emotion[e])
+            for e, a in zip(primaries, arousals)
+        ]
+        
+        for view, emotion_idx, valence, arousal, intensity in zip(views, primaries, valences, arousals, intensities):
+            self._apply_facet_emotion(
+                view, PLUTCHIK_EMOTIONS[emotion_idx], valence, arousal,
+                intensity, momentum_by_emotion[emotion_idx]
+            )
 
     def _update_emotional_resonance(self):
         """
         Cross-crystal emotional resonance: emotions spread through the lattice.
         """
         with self._facet_lock, self._energy_lock:
-            # Build emotional field map
-            emotional_field = {}
-            for fid, facet in self.registered_facets.items():
-                em_state = getattr(facet, "emotion_state", None)
-                if em_state and self.facet_energy.get(fid, 0) > 0.1:
-                    emotional_field[fid] = {
-                        "emotion": em_state.get("primary", "neutral"),
-                        "intensity": em_state.get("intensity", 0) * self.facet_energy[fid],
-                        "valence": em_state.get("valence", 0)
-                    }
+            energy = self._energy
+            snap = self._link_snapshot
+            indptr, indices, data = snap.csr_indptr, snap.csr_indices, snap.csr_data
+            linked_rows = len(indptr) - 1
+            
+            # Build emotional field: (row, intensity) per energized facet, plus
+            # the per-emotion totals for the global state
+            field_rows = []
+            emotion_weights = {}
+            for view in self._views.values():
+                em_state = getattr(view.facet, "emotion_state", None)
+                e = energy[view.row]
+                if em_state and e > 0.1:
+                    intensity = em_state.get("intensity", 0) * e
+                    field_rows.append((view.row, intensity))
+                    em = em_state.get("primary", "neutral")
+                    emotion_weights[em] = emotion_weights.get(em, 0) + intensity
             
-            # Spread emotional influence through links
-            with self._link_lock:
-                for source_fid, targets in self.facet_to_facet_links.items():
-                    if source_fid not in emotional_field:
-                        continue
-                    
-                    source_emotion = emotional_field[source_fid]
-                    for target_fid, link_strength in targets.items():
-                        if target_fid not in self.registered_facets:
-                            continue
-                        
-                        influence = source_emotion["intensity"] * link_strength * 0.1
-                        if influence > 0.01:
-                            self.facet_energy[target_fid] = self.facet_energy.get(target_fid, 0) + influence
+            # Spread emotional influence: scatter-add along each source's CSR row
+            # (same adjacency as dispersal, 0.1 coupling, per-edge 0.01 floor)
+            for row, intensity in field_rows:
+                if row >= linked_rows:
+                    continue
+                for k in range(indptr[row], indptr[row + 1]):
+                    influence = intensity * data[k] * 0.1
+                    if influence > 0.01:
+                        energy[indices[k]] += influence
             
             # Update global emotional state
-            if emotional_field:
-                emotion_weights = {}
-                for data in emotional_field.values():
-                    em = data["emotion"]
-                    emotion_weights[em] = emotion_weights.get(em, 0) + data["intensity"]
+            if emotion_weights:
+                dominant = max(emotion_weights, key=emotion_weights.get)
+                total_intensity = sum(emotion_weights.values())
+                self.global_emotional_state = {
+                    "primary": dominant,
+                    "intensity": min(1.0, emotion_weights[dominant] / (total_intensity + 1e-6))
+                }
                 
-                if emotion_weights:
-                    dominant = max(emotion_weights, key=emotion_weights.get)
-                    total_intensity = sum(emotion_weights.values())
-                    self.global_emotional_state = {
-                        "primary": dominant,
-                        "intensity": min(1.0, emotion_weights[dominant] / (total_intensity + 1e-6))
-                    }
-                    
-                    self.emotional_history.append(self.global_emotional_state.copy())
-                    if len(self.emotional_history) > 10:
-                        self.emotional_history.pop(0)
+                self.emotional_history.append(self.global_emotional_state.copy())  # maxlen=10
 
     # ------------------------------------------------------------------------
     # DEEP EMOTION MAPPING
     # ------------------------------------------------------------------------
-    def _update_facet_emotion(self, fid: str, facet_obj: Any):
-        energy = self.facet_energy.get(fid, 0.0)
-        pts = getattr(facet_obj, "get_facet_points", lambda: {})()
-        
-        coherence = pts.get("coherence", 0.5)
-        stability = pts.get("stability", 0.5)
-        complexity = pts.get("complexity", 0.5)
-        valence_raw = (coherence * 0.4 + stability * 0.4) - (complexity * 0.2)
-        valence = max(-1.0, min(1.0, valence_raw))
-        arousal = sigmoid(energy, k=4.0, x0=1.5)
-
-        primary = self._map_to_plutchik_dynamic(valence, arousal, pts)
-        
-        emotion_bias_map = {
-            'fear': ('neuroticism', 0.4, -1), 
-            'sadness': ('neuroticism', 0.4, -1),
-            'anger': ('neuroticism', 0.3, -1),
-            'disgust': ('neuroticism', 0.3, -1),
-            'joy': ('extraversion', 0.3, 1),
-            'trust': ('agreeableness', 0.25, 1),
-            'anticipation': ('openness', 0.2, 1)
-        }
-        
-        intensity_bias = 1.0
-        if primary in emotion_bias_map:
-            trait, weight, direction = emotion_bias_map[primary]
-            trait_value = getattr(self.personality, trait, 0.5)
-            intensity_bias += direction * (trait_value - 0.5) * weight
-
-        momentum_boost = 0.0
-        if self.emotional_history:
-            recent_primary = [h["primary"] for h in self.emotional_history[-3:]]
-            if recent_primary.count(primary) >= 2:
-                momentum_boost = 0.15
-
-        final_intensity = min(1.0, arousal * intensity_bias + momentum_boost)
-
-        if hasattr(facet_obj, "emotion_state"):
-             facet_obj.emotion_state = {
+    def _apply_facet_emotion(self, view: FacetView, primary: str, valence: float, arousal: float,
+                             final_intensity: float, momentum_boost: float):
+        """Writes the facet's emotion state and folds it into emotional momentum."""
+        fid = view.facet_id
+
+        if view.has_emotion_state:
+             view.facet.emotion_state = {
                  "primary": primary,
                  "intensity": round(final_intensity, 3),
                  "valence": round(valence, 3),
@@ -440,66 +655,38 @@ class DimensionalEnergyRegulator:
             self.emotional_momentum[fid] = {}
         self.emotional_momentum[fid][primary] = self.emotional_momentum[fid].get(primary, 0) * 0.9 + final_intensity * 0.1
 
-    def _map_to_plutchik_dynamic(self, v: float, a: float, pts: Dict[str, float]) -> str:
-        """Dynamic emotion mapping with smooth interpolation."""
-        emotion_scores = {
-            'joy': 0, 'trust': 0, 'fear': 0, 'surprise': 0,
-            'sadness': 0, 'disgust': 0, 'anger': 0, 'anticipation': 0
-        }
-        
-        if v > 0:
-            emotion_scores['joy'] += v * a
-            emotion_scores['trust'] += v * (1 - a)
-            emotion_scores['anticipation'] += v * 0.5
-        else:
-            neg_v = abs(v)
-            emotion_scores['anger'] += neg_v * a * pts.get('potential', 0.5)
-            emotion_scores['fear'] += neg_v * a * (1 - pts.get('potential', 0.5))
-            emotion_scores['sadness'] += neg_v * (1 - a)
-            emotion_scores['disgust'] += neg_v * (1 - a) * pts.get('stability', 0.5)
-        
-        if a > 0.6:
-            emotion_scores['surprise'] += (a - 0.6) * 2
-        elif a < 0.3:
-            emotion_scores['trust'] += (0.3 - a) * 2
-            
-        if pts.get('complexity', 0) > 0.7:
-            emotion_scores['anticipation'] += 0.3
-        if pts.get('stability', 0) < 0.3:
-            emotion_scores['fear'] += 0.3
-            
-        return max(emotion_scores, key=emotion_scores.get)
-
     # ------------------------------------------------------------------------
     # CURIOSITY & DIAGNOSTICS
     # ------------------------------------------------------------------------
     def _inject_curiosity_energy(self):
         """Curiosity-driven exploration - DIMENSIONAL batch injection."""
-        with self._energy_lock, self._facet_lock:
+        with self._facet_lock, self._energy_lock:
+            energy = self._energy
+            threshold = self.underexplored_threshold
             underexplored = [
-                fid for fid, energy in self.facet_energy.items()
-                if energy < self.underexplored_threshold
-                and hasattr(self.registered_facets.get(fid), 'state')
-                and self.registered_facets[fid].state == "ACTIVE"
+                view.row for view in self._views.values()
+                if energy[view.row] < threshold
+                and getattr(view.facet, 'state', None) == "ACTIVE"
             ]
             
             if underexplored:
-                boost_count = min(3, len(underexplored))
-                targets = random.sample(underexplored, boost_count)
+                rng = self._rng
+                targets = rng.sample(underexplored, min(3, len(underexplored)))
+                boosts = [rng.uniform(0.5, 1.5) * self.curiosity_injection_rate for _ in targets]
                 
-                # DIMENSIONAL: Batch injection
-                for fid in targets:
-                    boost = random.uniform(0.5, 1.5) * self.curiosity_injection_rate
-                    self.facet_energy[fid] += boost
+                # DIMENSIONAL: Batch scatter-add of the drawn boosts
+                for idx, boost in zip(targets, boosts):
+                    energy[idx] += boost
     
     def inject_energy_vector(self, facet_id: str, valence: float, arousal: float, tension: float):
-        """Vector energy injection - 3D energy space."""
+        """Vector energy injection - 3D energy space (KeyError if facet_id is unregistered)."""
         if not self.enable_vector_energy:
             scalar_energy = (abs(valence) + arousal + tension) / 3.0
             self.inject_energy(facet_id, scalar_energy)
             return
         
         with self._energy_lock:
+            row = self._fid_index[facet_id]
             if facet_id not in self.facet_energy_vector:
                 self.facet_energy_vector[facet_id] = {"valence": 0.0, "arousal": 0.0, "tension": 0.0}
             
@@ -510,7 +697,7 @@ class DimensionalEnergyRegulator:
             
             vec = self.facet_energy_vector[facet_id]
             magnitude = math.sqrt(vec["valence"]**2 + vec["arousal"]**2 + vec["tension"]**2)
-            self.facet_energy[facet_id] = magnitude
+            self._energy[row] = magnitude
     
     def get_temporal_diagnostics(self) -> Dict[str, Any]:
         """Returns comprehensive temporal dynamics."""
@@ -536,11 +723,17 @@ class DimensionalEnergyRegulator:
 
     def snapshot(self, top_n: int = 10) -> Tuple[float, List[Tuple[str, float, Dict[str, Any]]]]:
         """Returns current presence scale AND top energized facets."""
-        items = sorted(self.facet_energy.items(), key=lambda x: x[1], reverse=True)[:top_n]
-        res = []
-        for fid, e in items:
-            facet = self.registered_facets.get(fid)
-            if facet:
-                em_state = getattr(facet, "emotion_state", {"primary": "neutral", "intensity": 0.0})
+        # Pre-filter to registered facets, then partial-select the top_n with a
+        # bounded heap (O(N log top_n)) instead of sorting every facet.
+        with self._facet_lock, self._energy_lock:
+            registered = self.registered_facets
+            items = heapq.nlargest(
+                top_n,
+                ((fid, e) for fid, e in zip(self._fids, self._energy) if fid in registered),
+                key=lambda x: x[1]
+            )
+            res = []
+            for fid, e in items:
+                em_state = getattr(registered[fid], "emotion_state", {"primary": "neutral", "intensity": 0.0})
                 res.append((fid, round(e, 4), em_state))
         return self.current_presence_scale, res
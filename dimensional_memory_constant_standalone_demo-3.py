@@ -22,17 +22,25 @@ import os
 import uuid
 import logging
 import random
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from typing import Any, Deque, Dict, List, Optional, Tuple, Callable
 
 # --- Configuration Constants ---
 BASE_SAVE_FILE = "system_base_state.json"
 DELTA_LOG_FILE = "system_live.deltalog"
 TEMP_SAVE_FILE = "system_base_state.tmp"
 MERGE_INTERVAL_SECONDS = 30  # Run merge every 30 seconds for testing
+ASSESSMENT_LOG_MAX = 10000  # Recent law assessments kept; totals are counted separately
 LOG_FORMAT = '%(asctime)s - %(threadName)s - %(levelname)s - %(message)s'
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 
+# One shared compact encoder for the delta log and base state (no indent, no spaces)
+_encode_json = json.JSONEncoder(separators=(',', ':')).encode
+
+# Whitespace -> underscore in one translate() pass, for names embedded in dimension links
+_WS_TO_UNDERSCORE = str.maketrans({' ': '_', '\n': '_', '\t': '_'})
+
 # --- Global "Live Save" Components ---
 SAVE_QUEUE = queue.Queue()
 _save_thread_active = threading.Event()
@@ -75,10 +83,10 @@ class DataNode:
         
         # AFTER
         if modified:
-            logging.debug(f"Modifying Node {self.id}...")
+            logging.debug("Modifying Node %s...", self.id)
             self.last_modified_timestamp = time.time()
             SAVE_QUEUE.put(self)
-            logging.debug(f"Node {self.id} queued for live save.")
+            logging.debug("Node %s queued for live save.", self.id)
 
 
     def to_dict(self):
@@ -104,15 +112,16 @@ class DimensionalMemory:
     """
     def __init__(self):
         self.nodes: Dict[str, DataNode] = {}
-        self.dimension_index: Dict[str, List[str]] = {}
+        self.dimension_index: Dict[str, Dict[str, None]] = {}  # link -> node ids, insertion-ordered
         self.concept_index: Dict[str, str] = {}
+        self.session_platform_counts: Counter = Counter()  # top-level ingests per source platform this session; not persisted
         self.last_global_save_timestamp: float = 0.0
         self._load_from_base_file()
 
     def _load_from_base_file(self):
-        logging.info(f"Loading from {BASE_SAVE_FILE}...")
+        logging.info("Loading from %s...", BASE_SAVE_FILE)
         if not os.path.exists(BASE_SAVE_FILE):
-            logging.warning(f"{BASE_SAVE_FILE} not found. Starting fresh.")
+            logging.warning("%s not found. Starting fresh.", BASE_SAVE_FILE)
             return
         try:
             with open(BASE_SAVE_FILE, 'r') as f:
@@ -123,30 +132,27 @@ class DimensionalMemory:
                 node = DataNode.from_dict(node_data)
                 self.nodes[node_id] = node
                 self._update_indices(node)
-            logging.info(f"Load complete. {len(self.nodes)} nodes loaded.")
+            logging.info("Load complete. %s nodes loaded.", len(self.nodes))
         except Exception as e:
-            logging.error(f"CRITICAL: Failed to load {BASE_SAVE_FILE}. Error: {e}")
+            logging.error("CRITICAL: Failed to load %s. Error: %s", BASE_SAVE_FILE, e)
 
     def _update_indices(self, node: DataNode):
         for link in node.dimension_links:
-            if link not in self.dimension_index:
-                self.dimension_index[link] = []
-            if node.id not in self.dimension_index[link]:
-                self.dimension_index[link].append(node.id)
+            self.dimension_index.setdefault(link, {})[node.id] = None
         concept = node.payload.get("concept")
         if concept:
             self.concept_index[concept] = node.id
 
     def add_node(self, node: DataNode):
         if node.id in self.nodes:
-            logging.warning(f"Node {node.id} already exists. Overwriting.")
+            logging.warning("Node %s already exists. Overwriting.", node.id)
         self.nodes[node.id] = node
         self._update_indices(node)
         node.modify() # Trigger the save queue
 
     def modify_node(self, node_id: str, payload_update: Dict[str, Any] = None, link_update: List[str] = None):
         if node_id not in self.nodes:
-            logging.error(f"Modify failed: Node {node_id} not found.")
+            logging.error("Modify failed: Node %s not found.", node_id)
             return
         node = self.nodes[node_id]
         node.modify(payload_update, link_update)
@@ -173,7 +179,7 @@ class SecurityLawSet:
         logging.info("Security Law Set initialized.")
         
     def analyze_data(self, data: dict, parent_law: Optional[Any] = None) -> dict:
-        logging.info(f"SECURITY LAWSET: Analyzing {data.get('ip')}...")
+        logging.info("SECURITY LAWSET: Analyzing %s...", data.get('ip'))
         
         # 1. Standard "SecurityLaw" logic
         concept_name = f"IP_{data.get('ip')}"
@@ -207,7 +213,7 @@ class ClimateLawSet:
         logging.info("Climate Law Set initialized.")
         
     def analyze_data(self, data: dict, parent_law: Optional[Any] = None) -> dict:
-        logging.info(f"CLIMATE LAWSET: Analyzing {data.get('sensor_id')}...")
+        logging.info("CLIMATE LAWSET: Analyzing %s...", data.get('sensor_id'))
         
         # 1. Standard "ClimateLaw" logic
         concept_name = f"SENSOR_{data.get('sensor_id')}"
@@ -239,7 +245,7 @@ class TextLawSet:
         
     def analyze_data(self, data: dict, parent_law: Optional[Any] = None) -> dict:
         text = data.get("text", "")
-        logging.info(f"TEXT LAWSET: Analyzing '{text[:20]}...'")
+        logging.info("TEXT LAWSET: Analyzing '%s...'", text[:20])
         
         # 1. Standard logic
         sentiment = "positive" if "on track" in text else "negative" if "failed" in text else "neutral"
@@ -298,7 +304,7 @@ class ImageLawSet:
 class AudioLawSet:
     def __init__(self): self.name = "AUDIO"; self.fingerprint_keys = {"filepath", "duration", "artist"}
     def analyze_data(self, data: dict, parent_law: Optional[Any] = None) -> dict:
-        filepath = data.get("filepath", "unknown.aud"); artist = data.get("artist", "Unknown").replace(' ', '_')
+        filepath = data.get("filepath", "unknown.aud"); artist = data.get("artist", "Unknown").translate(_WS_TO_UNDERSCORE)
         dimensions = ["dim_theme:audio", f"dim_artist:{artist}"]
         payload_update = { "filepath": filepath, "duration_min": data.get("duration", 0) / 60.0 }
         if parent_law: dimensions.append(f"dim_mutator:{parent_law.name}")
@@ -352,7 +358,7 @@ class LawGenerator:
                 best_match = (domain, law_set)
                 
         if best_match:
-            logging.info(f"LAW GENERATOR: Closest match is '{best_match[0]}' (Score: {highest_score:.2f}).")
+            logging.info("LAW GENERATOR: Closest match is '%s' (Score: %.2f).", best_match[0], highest_score)
         else:
             logging.warning("LAW GENERATOR: No close match found. Will use fallback.")
         return best_match
@@ -362,7 +368,7 @@ class LawGenerator:
         Step 3: Generate the new "analyze_data" function by *adapting*
         the logic from the base law set.
         """
-        logging.info(f"LAW GENERATOR: Adapting laws from '{base_law_set.name}'...")
+        logging.info("LAW GENERATOR: Adapting laws from '%s'...", base_law_set.name)
         
         data_keys = list(data.keys())
         # --- PERFECTION: Smarter concept naming ---
@@ -376,7 +382,7 @@ class LawGenerator:
         
         # --- PERFECTION: Generated function must *also* accept parent_law ---
         def new_analyze_func(data_dict: dict, parent_law: Optional[Any] = None) -> dict:
-            logging.info(f"DYNAMIC LAWSET ({new_theme}): Analyzing {data_dict.get(concept_key)}...")
+            logging.info("DYNAMIC LAWSET (%s): Analyzing %s...", new_theme, data_dict.get(concept_key))
             
             concept_name = f"DYN_{data_dict.get(concept_key)}"
             dimensions = [
@@ -427,14 +433,18 @@ class LawGenerator:
                 }
             )
             
-            logging.info(f"LAW GENERATOR: Successfully generated new class '{NewLawSetClass.name}'.")
+            logging.info("LAW GENERATOR: Successfully generated new class '%s'.", NewLawSetClass.name)
             return new_domain_name, NewLawSetClass()
             
         except Exception as e:
-            logging.error(f"LAW GENERATOR: Failed to adapt law. Error: {e}")
+            logging.error("LAW GENERATOR: Failed to adapt law. Error: %s", e)
             return None, None
 
 
+# Bound on memoized key-set -> domain lookups before the memo is reset
+_DOMAIN_CACHE_MAX = 1024
+
+
 class EvolutionaryGovernanceEngine:
     """
     The "Conscious Mind." Now fully recursive and generational.
@@ -442,7 +452,9 @@ class EvolutionaryGovernanceEngine:
     
     def __init__(self, memory_system: DimensionalMemory):
         self.memory = memory_system
-        self.assessment_log = []
+        self.assessment_log: Deque[dict] = deque(maxlen=ASSESSMENT_LOG_MAX)
+        self.total_laws_applied = 0
+        self.total_laws_succeeded = 0
         
         # Load all "known" Law Set plug-ins
         self.law_sets: Dict[str, Any] = {
@@ -457,17 +469,34 @@ class EvolutionaryGovernanceEngine:
         }
         
         self.law_generator = LawGenerator(self.law_sets)
-        logging.info(f"Evolutionary Governor Online. Loaded {len(self.law_sets)} static Law Sets.")
+        # key-set fingerprint -> domain, valid while the law library size is unchanged
+        self._domain_cache: Dict[frozenset, str] = {}
+        self._domain_cache_laws = len(self.law_sets)
+        logging.info("Evolutionary Governor Online. Loaded %s static Law Sets.", len(self.law_sets))
 
     def _identify_domain(self, data: dict) -> Optional[str]:
         """Identifies the data's domain (static or dynamic)."""
-        data_fingerprint = set(data.keys())
+        data_fingerprint = frozenset(data.keys())
+        if self._domain_cache_laws != len(self.law_sets) or len(self._domain_cache) >= _DOMAIN_CACHE_MAX:
+            self._domain_cache.clear()
+            self._domain_cache_laws = len(self.law_sets)
+        domain = self._domain_cache.get(data_fingerprint)
+        if domain is not None:
+            return domain
+        
+        domain = self._match_domain(data_fingerprint)
+        if domain != "UNKNOWN":
+            self._domain_cache[data_fingerprint] = domain
+        return domain
+
+    def _match_domain(self, data_fingerprint: frozenset) -> str:
+        """First law set whose fingerprint keys are all present, else UNKNOWN"""
         for domain, law_set in self.law_sets.items():
             if hasattr(law_set, 'fingerprint_keys'):
                 if data_fingerprint.issuperset(law_set.fingerprint_keys):
                     return domain
         
-        logging.warning(f"DOMAIN ID: Could not identify domain for {data_fingerprint}")
+        logging.warning("DOMAIN ID: Could not identify domain for %s", data_fingerprint)
         return "UNKNOWN"
 
     def _find_deeper_data(self, data: dict) -> List[dict]:
@@ -489,28 +518,30 @@ class EvolutionaryGovernanceEngine:
         return deeper_items
 
     # --- PERFECTION: `ingest_data` is now recursive (Generational) ---
-    def ingest_data(self, data: dict, parent_node: Optional[DataNode] = None, parent_law_object: Optional[Any] = None):
+    def ingest_data(self, data: dict, parent_node: Optional[DataNode] = None, parent_law_object: Optional[Any] = None) -> Optional[DataNode]:
         """
         The main entry point. Now fully recursive.
+        Returns the node written for ``data`` (None if it was discarded).
         """
         # 1. Identify Domain
         domain = self._identify_domain(data)
             
         # 2. Handle "UNKNOWN" domain
         if domain == "UNKNOWN":
-            logging.info(f"GOVERNOR: Unknown data type. Engaging Law Generator...")
+            logging.info("GOVERNOR: Unknown data type. Engaging Law Generator...")
             new_domain, new_law_class = self.law_generator.generate_new_law(data)
             
             if new_domain and new_law_class:
-                logging.info(f"GOVERNOR: New Law Set '{new_domain}' generated! Adding to library.")
+                logging.info("GOVERNOR: New Law Set '%s' generated! Adding to library.", new_domain)
                 self.law_sets[new_domain] = new_law_class
                 domain = new_domain
             else:
-                logging.error(f"GOVERNOR: Law Generator failed. Discarding: {data}")
-                return
+                logging.error("GOVERNOR: Law Generator failed. Discarding: %s", data)
+                return None
             
         # 3. Apply domain-specific laws (with "mutation")
         law_set = self.law_sets.get(domain)
+        node_obj = None
         try:
             # --- PERFECTION: Pass the parent_law_object for mutation ---
             node_rules = law_set.analyze_data(data, parent_law_object)
@@ -520,11 +551,15 @@ class EvolutionaryGovernanceEngine:
             
             self.assess_law_application(domain, node_rules, node_obj)
 
+            if node_obj and parent_node is None:
+                # Only successful top-level writes count towards platform stats
+                self.memory.session_platform_counts[data.get('platform', 'other')] += 1
+
             # --- PERFECTION: The "Generational" Recursive Call ---
             if node_obj: # Only recurse if the parent was successfully written
                 deeper_data_items = self._find_deeper_data(data)
                 if deeper_data_items:
-                    logging.info(f"GOVERNOR: Found {len(deeper_data_items)} deeper items in '{node_obj.payload.get('concept')}'. Recursing...")
+                    logging.info("GOVERNOR: Found %s deeper items in '%s'. Recursing...", len(deeper_data_items), node_obj.payload.get('concept'))
                     for item in deeper_data_items:
                         # This is the "Generational" call
                         self.ingest_data(
@@ -534,7 +569,8 @@ class EvolutionaryGovernanceEngine:
                         )
             
         except Exception as e:
-            logging.critical(f"GOVERNOR: Law Set '{domain}' failed! Error: {e}", exc_info=True)
+            logging.critical("GOVERNOR: Law Set '%s' failed! Error: %s", domain, e, exc_info=True)
+        return node_obj
 
     # --- PERFECTION: `_auto_write_node` now handles two-way linking ---
     def _auto_write_node(self, rules: dict, parent_node: Optional[DataNode] = None) -> Optional[DataNode]:
@@ -581,10 +617,12 @@ class EvolutionaryGovernanceEngine:
         The "feedback loop." The Governor assesses its own work.
         """
         success = node_obj is not None
+        self.total_laws_applied += 1
+        self.total_laws_succeeded += success
         self.assessment_log.append({
             "timestamp": time.time(), "domain": domain, "success": success,
         })
-        logging.info(f"GOVERNOR: Assessed application of '{domain}'. Success: {success}")
+        logging.info("GOVERNOR: Assessed application of '%s'. Success: %s", domain, success)
 
 
 # ============================================================================
@@ -597,16 +635,16 @@ def continuous_save_thread():
     while _save_thread_active.is_set():
         try:
             node_to_save = SAVE_QUEUE.get(timeout=1.0)
-            log_entry = json.dumps(node_to_save.to_dict())
+            log_entry = _encode_json(node_to_save.to_dict())
             with open(DELTA_LOG_FILE, 'a') as f:
                 f.write(log_entry + '\n')
             SAVE_QUEUE.task_done()
-            logging.debug(f"SAVETHREAD: Node {node_to_save.id} written to log.")
+            logging.debug("SAVETHREAD: Node %s written to log.", node_to_save.id)
 
         except queue.Empty:
             continue
         except Exception as e:
-            logging.error(f"SAVETHREAD: Error: {e}")
+            logging.error("SAVETHREAD: Error: %s", e)
     logging.info("Save Thread shutting down.")
 
 def background_merge():
@@ -640,19 +678,19 @@ def background_merge():
                         if node_data['last_modified_timestamp'] > latest_timestamp:
                             latest_timestamp = node_data['last_modified_timestamp']
                     except json.JSONDecodeError:
-                        logging.warning(f"MERGETHREAD: Skipping corrupt line: {line}")
+                        logging.warning("MERGETHREAD: Skipping corrupt line: %s", line)
             
             merged_data = {
                 "last_global_save_timestamp": latest_timestamp, "nodes": current_state_nodes
             }
             with open(TEMP_SAVE_FILE, 'w') as f:
-                json.dump(merged_data, f, indent=2)
+                f.write(_encode_json(merged_data))
             
             os.replace(TEMP_SAVE_FILE, BASE_SAVE_FILE)
             os.remove(temp_log_file)
-            logging.info(f"MERGETHREAD: Merge complete. {len(current_state_nodes)} nodes in new base state.")
+            logging.info("MERGETHREAD: Merge complete. %s nodes in new base state.", len(current_state_nodes))
         except Exception as e:
-            logging.error(f"MERGETHREAD: Critical Error: {e}")
+            logging.error("MERGETHREAD: Critical Error: %s", e)
             if os.path.exists(temp_log_file):
                 os.rename(temp_log_file, DELTA_LOG_FILE)
     logging.info("Merge Thread shutting down.")
@@ -687,10 +725,10 @@ def stop_memory_system(save_thread: threading.Thread, merge_thread: threading.Th
         try:
             node_to_save = SAVE_QUEUE.get_nowait()
             with open(DELTA_LOG_FILE, 'a') as f:
-                f.write(json.dumps(node_to_save.to_dict()) + '\n')
+                f.write(_encode_json(node_to_save.to_dict()) + '\n')
             SAVE_QUEUE.task_done()
         except Exception as e:
-            logging.error(f"Shutdown save error: {e}")
+            logging.error("Shutdown save error: %s", e)
     logging.info("System shutdown complete.")
 
 
@@ -801,6 +839,6 @@ if __name__ == "__main__":
         print(f"  Error: {e}")
         print("!"*40)
 
-    print(f"\nGovernor assessment log contains {len(governor.assessment_log)} entries.")
+    print(f"\nGovernor assessed {governor.total_laws_applied} law applications.")
     print("System test complete. Check 'system_base_state.json' for final saved memory.")
 